@@ -11,7 +11,8 @@ import logging
 import os
 import sys
 import time
-from typing import Any, Dict, List, Optional, Union, TypeVar
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Union, TypeVar
 
 from exceptions import ConfigurationError
 from year_utils import calculate_year_short
@@ -66,6 +67,10 @@ class ConfigLoader:
         # ユーザー設定を別途保持（行事名設定などで使用）
         self.user_config: Dict[str, Any] = {}
 
+        # bulk_update中のネスト数と、保存を保留している変更があるか
+        self._bulk_depth = 0
+        self._bulk_dirty = False
+
         self.config: Dict[str, Any] = self._load_config()
         self.year: str = self.config['year']
         # year_shortは自動計算（設定ファイルの値は無視）
@@ -366,6 +371,32 @@ class ConfigLoader:
                 current_user = current_user[key]
             current_user[keys[-1]] = value
 
+        self._bulk_dirty = True
+
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """
+        複数の設定変更をまとめて1回で保存する
+
+        ブロック内の save_config() や行事名の保存などはファイルに書き込まず、
+        変更があればブロックを抜けたときに1回だけ保存する。
+        例外でブロックを抜けた場合は保存しない（メモリ上の変更は残る）。
+
+        Raises:
+            ConfigurationError: 保存に失敗した場合
+        """
+        if self._bulk_depth == 0:
+            self._bulk_dirty = False
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+        # 例外時はfinallyの後に再送出されるため、ここは正常終了時のみ到達する
+        if self._bulk_depth == 0 and self._bulk_dirty:
+            self._bulk_dirty = False
+            self.save_config()
+
     def save_config(self) -> None:
         """
         現在の保存モードに応じて設定を保存
@@ -373,6 +404,10 @@ class ConfigLoader:
         Raises:
             ConfigurationError: 保存に失敗した場合
         """
+        if self._bulk_depth > 0:
+            # bulk_updateの終了時にまとめて保存する
+            self._bulk_dirty = True
+            return
         self._persist_config()
         save_target = self.user_config_path if self.use_user_config else self.config_path
         logger.info(f"設定を保存しました: {save_target}")
@@ -393,6 +428,7 @@ class ConfigLoader:
         self.year_short = year_short if year_short is not None else calculate_year_short(year)
         self.config['year'] = year
         self.config['year_short'] = self.year_short
+        self._bulk_dirty = True
 
     def get_event_names(self, category: str) -> List[str]:
         """
@@ -478,7 +514,10 @@ class ConfigLoader:
         return True
 
     def _persist_config(self) -> None:
-        """現在の保存モードに合わせて設定を永続化する。"""
+        """現在の保存モードに合わせて設定を永続化する（bulk_update中は保存を保留）。"""
+        if self._bulk_depth > 0:
+            self._bulk_dirty = True
+            return
         if self.use_user_config:
             self._save_user_config()
         else:
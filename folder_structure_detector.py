@@ -7,9 +7,11 @@ import logging
 import os
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
 
+from exceptions import CancelledError
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,21 +42,29 @@ class FolderStructureDetector:
     # パフォーマンス設定
     MAX_SCAN_DEPTH = 10  # 最大スキャン深度（深いプロジェクトにも対応）
 
-    def detect_structure(self, directory_path: str) -> DetectionResult:
+    def detect_structure(
+        self,
+        directory_path: str,
+        cancel_check: Optional[Callable[[], bool]] = None
+    ) -> DetectionResult:
         """
         ディレクトリ構造を分析して計画タイプを判定
 
         Args:
             directory_path: 分析対象のディレクトリパス
+            cancel_check: キャンセル状態をチェックするコールバック関数
 
         Returns:
             DetectionResult: 判定結果
+
+        Raises:
+            CancelledError: スキャン中にキャンセルされた場合
         """
         logger.info(f"フォルダ構造分析を開始: {directory_path}")
 
         try:
             # ステップ1: 構造をスキャン
-            scan_result = self._scan_directory(directory_path)
+            scan_result = self._scan_directory(directory_path, cancel_check)
 
             # ステップ2: スコアリング
             education_score = self._calculate_education_score(scan_result)
@@ -73,6 +83,10 @@ class FolderStructureDetector:
 
             return result
 
+        except CancelledError:
+            logger.info(f"フォルダ構造分析がキャンセルされました: {directory_path}")
+            raise
+
         except Exception as e:
             logger.error(f"フォルダ構造分析エラー: {e}", exc_info=True)
             # エラー時は行事計画（デフォルト）
@@ -83,7 +97,11 @@ class FolderStructureDetector:
                 issues=[f"分析エラー: {e}"]
             )
 
-    def _scan_directory(self, directory_path: str) -> Dict[str, Any]:
+    def _scan_directory(
+        self,
+        directory_path: str,
+        cancel_check: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, Any]:
         """ディレクトリ構造をスキャン"""
         path = Path(directory_path)
 
@@ -114,7 +132,7 @@ class FolderStructureDetector:
 
             if item_path.is_dir():
                 # メインディレクトリの分析
-                dir_info = self._analyze_directory(item_path, depth=2)
+                dir_info = self._analyze_directory(item_path, depth=2, cancel_check=cancel_check)
                 main_dirs.append(dir_info)
                 max_depth = max(max_depth, dir_info['max_depth'])
             elif item_path.is_file():
@@ -146,7 +164,8 @@ class FolderStructureDetector:
         return result
 
     def _analyze_directory(
-        self, dir_path: Path, depth: int
+        self, dir_path: Path, depth: int,
+        cancel_check: Optional[Callable[[], bool]] = None
     ) -> Dict[str, Any]:
         """
         ディレクトリを再帰的に分析
@@ -154,10 +173,18 @@ class FolderStructureDetector:
         Args:
             dir_path: 分析対象のディレクトリPath
             depth: 現在の階層深度
+            cancel_check: キャンセル状態をチェックするコールバック関数
 
         Returns:
             Dict[str, Any]: ディレクトリ情報
+
+        Raises:
+            CancelledError: キャンセルされた場合
         """
+        # ディレクトリ単位でキャンセルを確認（ネットワークドライブの大きなフォルダ対策）
+        if cancel_check is not None and cancel_check():
+            raise CancelledError("フォルダ構造分析がキャンセルされました")
+
         # 深さ制限
         if depth > self.MAX_SCAN_DEPTH:
             return {
@@ -201,7 +228,7 @@ class FolderStructureDetector:
                     continue
 
                 if item.is_dir():
-                    sub_info = self._analyze_directory(item, depth + 1)
+                    sub_info = self._analyze_directory(item, depth + 1, cancel_check)
                     subfolders.append(sub_info)
                     max_depth = max(max_depth, sub_info['max_depth'])
                 elif item.is_file():
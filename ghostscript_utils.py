@@ -4,6 +4,7 @@ Ghostscriptユーティリティモジュール
 Ghostscriptの検出、インストール確認、パス設定を行う
 """
 import os
+import shutil
 import subprocess
 import logging
 import winreg
@@ -125,21 +126,11 @@ class GhostscriptManager:
 
     @classmethod
     def _find_from_path_env(cls) -> Optional[str]:
-        """PATH環境変数からGhostscriptを検索"""
+        """PATH環境変数からGhostscriptを検索（whereコマンドを起動せずshutil.whichで探す）"""
         for exe_name in cls.EXECUTABLE_NAMES:
-            try:
-                result = subprocess.run(
-                    ["where", exe_name],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    paths = result.stdout.strip().split("\n")
-                    if paths and os.path.exists(paths[0]):
-                        return paths[0]
-            except Exception:
-                continue
+            path = shutil.which(exe_name)
+            if path:
+                return path
 
         return None
 
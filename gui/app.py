@@ -164,12 +164,10 @@ class PDFMergeApp:
 
     def _on_closing(self) -> None:
         """終了時の処理（バックグラウンドスレッド確認付き）"""
-        # デーモンスレッド以外のバックグラウンドスレッドが動作中かチェック
-        active_threads = [
-            t for t in threading.enumerate()
-            if t != threading.main_thread() and t.is_alive() and not t.daemon
-        ]
-        if active_threads:
+        # 各タブのワーカーで処理が実行中かチェック
+        # （ワーカースレッドは待機中も生存しているため、スレッド一覧ではなくタスクの状態で判定）
+        tabs = [self.pdf_tab, self.excel_tab, self.settings_tab]
+        if any(tab.is_task_running() for tab in tabs):
             result = messagebox.askyesno(
                 "確認",
                 "バックグラウンド処理が実行中です。\n\n"
@@ -180,6 +178,11 @@ class PDFMergeApp:
             if not result:
                 return
 
+        # ワーカーはデーモンスレッドのため、実行中の処理はウィンドウの破棄後にプロセスとともに終了する
+        # （PDF統合にはキャンセルも要求される）
+        for tab in tabs:
+            tab.shutdown_executor()
+
         self._save_last_settings()
         self.root.destroy()
 
@@ -3,9 +3,23 @@
 
 各機能タブのコンポーネント
 """
+from typing import Any
+
 from gui.tabs.pdf_tab import PDFTab
 from gui.tabs.excel_tab import ExcelTab
-from gui.tabs.file_tab import FileTab
 from gui.tabs.settings_tab import SettingsTab
 
 __all__ = ['PDFTab', 'ExcelTab', 'FileTab', 'SettingsTab']
+
+
+def __getattr__(name: str) -> Any:
+    """
+    FileTabを遅延インポート
+
+    ファイル管理タブは未実装のためアプリ起動時には使用されない。
+    パッケージ読み込み時にクラス定義を評価しないよう、参照時に読み込む。
+    """
+    if name == 'FileTab':
+        from gui.tabs.file_tab import FileTab
+        return FileTab
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
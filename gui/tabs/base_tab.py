@@ -4,15 +4,21 @@
 全てのタブで共有される基本機能を提供
 """
 import logging
+import queue
+import threading
 import tkinter as tk
+from collections import deque
+from concurrent.futures import Future
 from tkinter import ttk, scrolledtext
-from typing import Optional, Callable, Tuple, TYPE_CHECKING
+from typing import Any, List, Optional, Callable, Tuple, TYPE_CHECKING
 
-from gui.utils import log_message
+from gui.utils import format_log_line
 
 if TYPE_CHECKING:
     from config_loader import ConfigLoader
 
+logger = logging.getLogger(__name__)
+
 
 class GUILogHandler(logging.Handler):
     """GUIのログウィジェットに出力するログハンドラ"""
@@ -44,9 +50,105 @@ class GUILogHandler(logging.Handler):
             self.handleError(record)
 
 
+class DaemonThreadPoolExecutor:
+    """
+    デーモンスレッドで動作するワーカープール（submitはconcurrent.futures.Futureを返す）
+
+    ThreadPoolExecutorのワーカーは終了時にjoinされるため、ウィンドウを閉じても
+    実行中のタスクが終わるまでプロセスが残ってしまう。アプリ終了で処理を中断できるよう、
+    ワーカーはデーモンスレッドとして作成する（従来のthreading.Thread(daemon=True)と同じ扱い）。
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "") -> None:
+        """
+        Args:
+            max_workers: ワーカースレッドの最大数
+            thread_name_prefix: ワーカースレッド名の接頭辞
+        """
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix or "DaemonWorker"
+        self._work_queue: "queue.SimpleQueue[Optional[Tuple[Future[Any], Callable[[], Any]]]]" = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        # 待機中のワーカー数（空きがあれば新しいスレッドを作らない）
+        self._idle_semaphore = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable[[], Any]) -> "Future[Any]":
+        """
+        関数をワーカーで実行
+
+        Args:
+            fn: ワーカースレッドで実行する関数
+
+        Returns:
+            Future
+
+        Raises:
+            RuntimeError: shutdown後に呼ばれた場合
+        """
+        future: "Future[Any]" = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("shutdown後のワーカープールにはタスクを投入できません")
+            self._work_queue.put((future, fn))
+            if not self._idle_semaphore.acquire(blocking=False) and len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _worker(self) -> None:
+        """キューからタスクを取り出して実行（Noneを受け取ったら終了）"""
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+            future, fn = item
+            del item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn()
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            # 例外やタスクへの参照を次のタスクまで保持しない
+            del future, fn
+            self._idle_semaphore.release()
+
+    def shutdown(self) -> None:
+        """
+        ワーカーを停止（未開始のタスクはキャンセル、実行中のタスクは待たない）
+
+        実行中のタスクはデーモンスレッド上で動き続けるが、プロセスの終了は妨げない。
+        """
+        with self._lock:
+            self._shutdown = True
+            while True:
+                try:
+                    item = self._work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+            for _ in self._threads:
+                self._work_queue.put(None)
+
+
 class BaseTab:
     """タブの基底クラス"""
 
+    # バックグラウンド処理用ワーカーのスレッド数
+    MAX_WORKERS = 1
+
+    # ログ書き込みをまとめる間隔（ミリ秒）
+    LOG_FLUSH_INTERVAL_MS = 50
+
     def __init__(self, notebook: ttk.Notebook, config: "ConfigLoader", status_bar: tk.Label) -> None:
         """
         Args:
@@ -59,6 +161,75 @@ class BaseTab:
         self.status_bar = status_bar
         self.tab = ttk.Frame(notebook)
         self.log_widget: Optional[scrolledtext.ScrolledText] = None
+        # バックグラウンド処理用のワーカー（初回使用時に作成し、以降は再利用）
+        self._executor: Optional[DaemonThreadPoolExecutor] = None
+        self._task_future: "Optional[Future[Any]]" = None
+        # 未表示のログ行（どのスレッドからも追加可、メインスレッドでまとめて表示）
+        # ログフレーム作成前は溜まる一方になるが、行を失わないよう上限は設けない
+        self._log_queue: "deque[str]" = deque()
+        self._log_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._gui_handler: Optional[GUILogHandler] = None
+        # create_scrollable_containerで設定されるマウスホイールのバインド処理
+        self._bind_mousewheel: Optional[Callable[[tk.Widget], None]] = None
+
+    def submit_task(self, task: Callable[[], Any]) -> "Optional[Future[Any]]":
+        """
+        バックグラウンドタスクをタブ専用のワーカースレッドで実行
+
+        タスクごとにスレッドを生成せず、タブ専用のワーカープールを再利用する。
+        前のタスクが実行中の場合は新しいタスクを受け付けない（多重実行防止）。
+
+        Args:
+            task: ワーカースレッドで実行する関数
+
+        Returns:
+            Future（前のタスクが実行中で受け付けなかった場合はNone）
+        """
+        if self.is_task_running():
+            logger.warning("前の処理が実行中のため、新しい処理を受け付けませんでした")
+            return None
+
+        self._task_future = self._get_executor().submit(task)
+        return self._task_future
+
+    def run_in_background(self, func: Callable[[], Any]) -> "Future[Any]":
+        """
+        補助的な処理（フォルダ判定など）をタブのワーカーで実行
+
+        submit_taskと異なり多重実行チェックを行わず、is_task_runningの対象にもならない。
+
+        Args:
+            func: ワーカースレッドで実行する関数
+
+        Returns:
+            Future
+        """
+        return self._get_executor().submit(func)
+
+    def _get_executor(self) -> DaemonThreadPoolExecutor:
+        """タブ専用のワーカーを取得（初回のみ作成）"""
+        if self._executor is None:
+            self._executor = DaemonThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS, thread_name_prefix=type(self).__name__
+            )
+        return self._executor
+
+    def is_task_running(self) -> bool:
+        """submit_taskで投入したタスクが実行中（または待機中）かどうか"""
+        return self._task_future is not None and not self._task_future.done()
+
+    def shutdown_executor(self) -> None:
+        """
+        ワーカーを停止（未開始のタスクはキャンセル、実行中のタスクは待たない）
+
+        ワーカーはデーモンスレッドのため、実行中のタスクはアプリの終了とともに中断される。
+        """
+        if self._task_future is not None:
+            self._task_future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def add_to_notebook(self, text: str) -> None:
         """タブをNotebookに追加"""
@@ -82,15 +253,19 @@ class BaseTab:
         )
         self.log_widget.pack(fill="both", expand=True)
 
+        # ログフレーム作成前に出力されたログを表示
+        if self._log_queue:
+            self._schedule_log_flush()
+
     def setup_gui_logging(self, logger_names: list = None) -> None:
         """
-        ロガーにGUIハンドラを追加して、ログをGUIに表示する
+        ロガーにGUIハンドラを追加して、ログをGUIに表示する（追加済みの場合は何もしない）
 
         Args:
             logger_names: ハンドラを追加するロガー名のリスト
                          省略時は主要モジュールのロガーに追加
         """
-        if self.log_widget is None:
+        if self.log_widget is None or self._gui_handler is not None:
             return
 
         if logger_names is None:
@@ -99,7 +274,7 @@ class BaseTab:
 
         # GUIログハンドラを作成
         self._gui_handler = GUILogHandler(
-            lambda msg, msg_type: log_message(self.log_widget, msg, msg_type) if self.log_widget else None
+            lambda msg, msg_type: self.log(msg, msg_type)
         )
         self._gui_handler.setLevel(logging.INFO)
         formatter = logging.Formatter('%(message)s')
@@ -117,7 +292,7 @@ class BaseTab:
 
     def remove_gui_logging(self) -> None:
         """GUIログハンドラを削除"""
-        if hasattr(self, '_gui_handler') and self._gui_handler:
+        if self._gui_handler:
             from constants import AppConstants
 
             for name in AppConstants.GUI_LOGGER_NAMES:
@@ -134,8 +309,56 @@ class BaseTab:
             message: ログメッセージ
             msg_type: メッセージタイプ ("info", "success", "warning", "error", "normal")
         """
-        if self.log_widget:
-            log_message(self.log_widget, message, msg_type)
+        line = format_log_line(message, msg_type)
+        with self._log_lock:
+            self._log_queue.append(line)
+
+        # ログフレーム作成前はキューに保持し、create_log_frameで表示する
+        if self.log_widget is not None:
+            self._schedule_log_flush()
+
+    def _schedule_log_flush(self) -> None:
+        """ログ表示を予約（予約済みなら何もしない）"""
+        with self._log_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            self.tab.after(self.LOG_FLUSH_INTERVAL_MS, self._flush_logs)
+        except tk.TclError:
+            pass  # ウィジェットが破棄されている場合は無視
+
+    def _flush_logs(self) -> None:
+        """
+        溜まったログをまとめてログウィジェットに出力（メインスレッドで実行）
+
+        1行ごとにinsertするとその都度再描画が走るため、1回のinsertで書き込む。
+        """
+        with self._log_lock:
+            self._flush_scheduled = False
+            lines = list(self._log_queue)
+            self._log_queue.clear()
+
+        if not lines or self.log_widget is None:
+            return
+
+        try:
+            self.log_widget.config(state="normal")
+            self.log_widget.insert(tk.END, "".join(lines))
+            self.log_widget.see(tk.END)
+            self.log_widget.config(state="disabled")
+        except tk.TclError:
+            pass  # ウィジェットが破棄されている場合は無視
+
+    def bind_mousewheel(self, widget: tk.Widget) -> None:
+        """
+        スクロール可能なコンテナ内に後から作成したウィジェットにマウスホイール処理を適用
+
+        Args:
+            widget: 対象のウィジェット（子ウィジェットにも再帰的に適用）
+        """
+        if self._bind_mousewheel is not None:
+            self._bind_mousewheel(widget)
 
     def update_status(self, message: str) -> None:
         """
@@ -166,8 +389,10 @@ class BaseTab:
         scrollable_frame = tk.Frame(canvas, bg="#f0f0f0")
 
         # scrollregionを更新する関数
+        # <Configure>の時点でフレームのサイズは確定しているため、update_idletasksで
+        # 保留中の再配置・再描画を強制しない（UI構築中に子ウィジェットを追加するたびに
+        # レイアウト計算が走るのを防ぎ、アイドル時の1回にまとめる）
         def update_scrollregion(event: Optional[tk.Event] = None) -> None:
-            canvas.update_idletasks()
             canvas.configure(scrollregion=canvas.bbox("all"))
 
         scrollable_frame.bind("<Configure>", update_scrollregion)
@@ -197,6 +422,9 @@ class BaseTab:
         scrollbar.pack(side="right", fill="y")
         canvas.pack(side="left", fill="both", expand=True)
 
+        # 後から作成したウィジェットにもbind_mousewheelで適用できるよう保持
+        self._bind_mousewheel = bind_mousewheel_recursive
+
         # マウスホイール処理を遅延初期化（パフォーマンス向上）
         def deferred_mousewheel_bind() -> None:
             bind_mousewheel_recursive(scrollable_frame)
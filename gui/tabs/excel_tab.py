@@ -5,6 +5,7 @@ Excel自動更新機能のUIを提供
 """
 import logging
 import os
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
@@ -21,7 +22,6 @@ except ImportError:
 from gui.tabs.base_tab import BaseTab
 from gui.utils import set_button_state, create_hover_button, open_file_or_folder, create_tooltip, thread_safe_call
 from path_validator import PathValidator
-from update_excel_files import ExcelTransfer
 
 if TYPE_CHECKING:
     from config_loader import ConfigLoader
@@ -51,6 +51,10 @@ class ExcelTab(BaseTab):
         # 設定タブへの参照（後から設定される）
         self.settings_tab: Optional[Any] = None
 
+        # ワーカースレッドからの進捗メッセージ（メインスレッドで定期的に取り出す）
+        self._progress_q: "queue.Queue[str]" = queue.Queue()
+        self._progress_active = False
+
         self._create_ui()
         self.add_to_notebook("📊 Excel処理")
 
@@ -472,6 +476,10 @@ class ExcelTab(BaseTab):
 
     def _run_excel_update(self) -> None:
         """Excelデータ更新を実行"""
+        if self.is_task_running():
+            logger.info("Excelデータ更新は既に実行中です")
+            return
+
         # ファイルが選択されているか確認
         if not self.ref_file_path or not self.target_file_path:
             missing = []
@@ -521,11 +529,10 @@ class ExcelTab(BaseTab):
                 self.log(f"参照シート: {ref_sheet}", "info")
                 self.log(f"ターゲットシート: {target_sheet}", "info")
 
-                # 進捗コールバック関数を定義
+                # 進捗コールバック関数を定義（ワーカーはキューに積むだけでTkに触れない）
                 def progress_callback(message: str) -> None:
-                    """進捗状況をGUIに反映"""
-                    self.log(message, "info")
-                    self.update_status(message)
+                    """進捗状況をキューに追加（GUIへの反映は_drain_progressで行う）"""
+                    self._progress_q.put(message)
 
                 # ステップ1: ConfigLoaderから最新の行事名を取得してターゲットExcelに設定
                 self.log("📝 ステップ1: 行事名をターゲットExcelに設定中...", "info")
@@ -535,6 +542,9 @@ class ExcelTab(BaseTab):
                 student_council_events = self.config.get_event_names("student_council_events")
                 other_activities = self.config.get_event_names("other_activities")
 
+                # 転記モジュールは実行時に読み込む（GUI起動時の読み込みを軽くするため）
+                from update_excel_files import ExcelTransfer
+
                 # 行事名を設定するための一時的なExcelTransferインスタンス
                 temp_transfer = ExcelTransfer(
                     ref_filename="",  # 行事名設定では参照ファイル不要
@@ -587,9 +597,30 @@ class ExcelTab(BaseTab):
                 thread_safe_call(self.tab, lambda: messagebox.showerror(
                     "実行エラー", f"エラーが発生しました。\n\n詳細:\n{error_msg}"
                 ))
+            finally:
+                self._progress_active = False
 
-        thread = threading.Thread(target=task, daemon=True)
-        thread.start()
+        self._progress_active = True
+        self.tab.after(100, self._drain_progress)
+
+        self.submit_task(task)
+
+    def _drain_progress(self) -> None:
+        """キューに溜まった進捗メッセージをまとめてGUIに反映（メインスレッドで実行）"""
+        while True:
+            try:
+                message = self._progress_q.get_nowait()
+            except queue.Empty:
+                break
+            self.log(message, "info")
+            self.update_status(message)
+
+        # 処理中、または取り出し後に追加されたメッセージがあれば次のティックを予約
+        if self._progress_active or not self._progress_q.empty():
+            try:
+                self.tab.after(100, self._drain_progress)
+            except tk.TclError:
+                pass  # ウィジェットが破棄されている場合は無視
 
     def _read_event_names_from_excel(self) -> None:
         """Excelから行事名を読み込み（ワンクリック）"""
@@ -665,6 +696,8 @@ class ExcelTab(BaseTab):
 
         def task():
             try:
+                from update_excel_files import ExcelTransfer
+
                 # ExcelTransferインスタンス作成（COM管理はExcelTransferに任せる）
                 transfer = ExcelTransfer(
                     ref_filename="",  # 行事名読み込みでは参照ファイル不要
@@ -5,11 +5,19 @@ PDF統合機能のUIを提供
 2025年ベストプラクティス準拠版
 """
 import logging
+import os
+import stat
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
 import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TYPE_CHECKING
 
 from gui.tabs.base_tab import BaseTab
 from gui.utils import set_button_state, create_hover_button, thread_safe_call, open_file_or_folder, create_tooltip
@@ -19,23 +27,91 @@ from gui.ui_constants import (
     UIMessages, UILabels, UITooltips,
     UIWidgetSizes, UIIcons, UIColors
 )
-from pdf_converter import PDFConverter
-from pdf_processor import PDFProcessor
-from document_collector import DocumentCollector
-from pdf_merge_orchestrator import PDFMergeOrchestrator
 from exceptions import CancelledError
-from path_validator import PathValidator
+from folder_structure_detector import DetectionResult, FolderStructureDetector, PlanType
+from path_validator import PathValidator, StatCache
 
 if TYPE_CHECKING:
     from config_loader import ConfigLoader
+    from pdf_converter import PDFConverter
+    from pdf_processor import PDFProcessor
+    from document_collector import DocumentCollector
+    from pdf_merge_orchestrator import PDFMergeOrchestrator
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_pdf_classes() -> Tuple[
+    Type["PDFConverter"], Type["PDFProcessor"],
+    Type["DocumentCollector"], Type["PDFMergeOrchestrator"]
+]:
+    """
+    PDF処理クラスを遅延インポートして返す
+
+    PDF関連モジュールはPyPDF2/reportlab/fitz等を読み込むため、
+    タブ構築時ではなく初回実行時にインポートして起動時間を短縮する。
+    結果はキャッシュされるため、2回目以降の実行では再解決しない。
+
+    Returns:
+        (PDFConverter, PDFProcessor, DocumentCollector, PDFMergeOrchestrator)
+    """
+    from pdf_converter import PDFConverter
+    from pdf_processor import PDFProcessor
+    from document_collector import DocumentCollector
+    from pdf_merge_orchestrator import PDFMergeOrchestrator
+
+    return PDFConverter, PDFProcessor, DocumentCollector, PDFMergeOrchestrator
+
+
+# _init_fontsで作成したフォント（作成したルートウィンドウと組で保持）
+_fonts_root: Optional[tk.Misc] = None
+_fonts: Optional[SimpleNamespace] = None
+
+
+def _init_fonts(root: tk.Misc) -> SimpleNamespace:
+    """
+    タブで使うフォントオブジェクトを返す（ルートウィンドウごとに1回だけ作成）
+
+    タプル指定のフォントはウィジェット作成・config呼び出しのたびに
+    Tk側で解析されるため、名前付きフォントを作成して使い回す。
+
+    Args:
+        root: フォントを作成するルートウィンドウ
+
+    Returns:
+        MEIRIO_9, MEIRIO_10, MEIRIO_10_BOLD, MEIRIO_11_BOLD を持つ名前空間
+    """
+    global _fonts_root, _fonts
+    if _fonts is None or _fonts_root is not root:
+        _fonts = SimpleNamespace(
+            MEIRIO_9=tkfont.Font(root=root, family="メイリオ", size=9),
+            MEIRIO_10=tkfont.Font(root=root, family="メイリオ", size=10),
+            MEIRIO_10_BOLD=tkfont.Font(root=root, family="メイリオ", size=10, weight="bold"),
+            MEIRIO_11_BOLD=tkfont.Font(root=root, family="メイリオ", size=11, weight="bold"),
+        )
+        _fonts_root = root
+    return _fonts
+
+
 class PDFTab(BaseTab):
     """PDF統合タブ"""
 
+    # PDF統合の実行中でもフォルダ構造判定が待たされないよう2スレッドにする
+    MAX_WORKERS = 2
+
+    # 入力検証のデバウンス間隔（ミリ秒）: 直近の検証コストに応じてこの範囲で調整
+    VALIDATION_DELAY_MIN_MS = 50
+    VALIDATION_DELAY_MAX_MS = 400
+    VALIDATION_DELAY_DEFAULT_MS = 300  # 計測値がまだない場合
+
+    # 入力欄の検証結果を再利用する期間（秒）
+    VALIDATION_CACHE_TTL = 1.0
+
+    # フォルダ構造判定結果のキャッシュ件数
+    DETECTION_CACHE_SIZE = 16
+
     def __init__(
         self,
         notebook: ttk.Notebook,
@@ -49,8 +125,46 @@ class PDFTab(BaseTab):
         self.input_dir_var = input_dir_var
         self.output_file_var = output_file_var
         self.plan_type_var = plan_type_var
-        # スレッドセーフなキャンセルフラグ（threading.Eventを使用）
-        self._cancel_event = threading.Event()
+        # キャンセルフラグ（UIスレッドが書き込み、ワーカーはcancel_check経由で読むだけ）
+        # bool属性の読み書きはアトミックなため、待機が不要な一方向のフラグにはEventを使わない
+        self._cancelled = False
+
+        # ファイルダイアログの初期ディレクトリ（前回選択した場所を記憶）
+        self._last_input_dir: Optional[Path] = None
+        self._last_output_dir: Optional[Path] = None
+
+        # 実行間で再利用するPDFProcessor（フォント登録のコストを毎回払わないため）
+        self._pdf_processor: Optional["PDFProcessor"] = None
+        self._pdf_processor_font: Optional[str] = None
+
+        # 実行間で再利用するコンバーター・コレクター・オーケストレーターと、生成時の設定
+        self._pipeline: Optional[Tuple["PDFConverter", "DocumentCollector", "PDFMergeOrchestrator"]] = None
+        self._pipeline_key: Optional[Tuple[Any, ...]] = None
+        # 表示中の一太郎変換ダイアログ（UIスレッドからのみ操作）
+        self._ichitaro_dialog: Optional[IchitaroConversionDialog] = None
+
+        # フォルダ構造判定（判定結果は (パス, 更新時刻) ごとにキャッシュ）
+        self._detector = FolderStructureDetector()
+        self._detection_cache: "OrderedDict[Tuple[str, int], DetectionResult]" = OrderedDict()
+        # 実行中の判定（新しいフォルダが選択されたらキャンセルする）
+        self._detect_future: "Optional[Future[Any]]" = None
+        self._detect_cancel_event: Optional[threading.Event] = None
+
+        # 入力欄の検証結果キャッシュ: (種別, パス文字列) -> (検証時刻, 検証結果)
+        # 検証はワーカースレッドで行うため、読み書きはロック下で行う
+        self._validation_cache: Dict[
+            Tuple[str, str], Tuple[float, Tuple[bool, Optional[str], Optional[Path]]]
+        ] = {}
+        self._validation_lock = threading.Lock()
+        # 実行中の検証と、最新の検証を識別する番号（古い検証結果は表示しない）
+        self._validation_future: "Optional[Future[Any]]" = None
+        self._validation_generation = 0
+        # 最後に検証を開始した (入力パス, 出力パス)（同じ内容なら検証し直さない）
+        self._last_validated: Optional[Tuple[str, str]] = None
+
+        # ダイアログで選択・検証済みのパス（入力欄が変更されたらクリア）
+        self._validated_input: Optional[Path] = None
+        self._validated_output: Optional[Path] = None
 
         # 検証状態のラベル（後で作成）
         self.input_validation_label: Optional[tk.Label] = None
@@ -59,18 +173,37 @@ class PDFTab(BaseTab):
         self._create_ui()
         self.add_to_notebook("📄 PDF統合")
 
-        # 検証のデバウンス用タイマー
+        # 検証のデバウンス用タイマーと、直近の検証にかかった時間（秒）
         self._validation_timer = None
+        self._validation_costs: "deque[float]" = deque(maxlen=8)
 
         # 入力フィールドの変更を監視（デバウンス処理付き）
-        self.input_dir_var.trace_add('write', lambda *args: self._schedule_validation())
-        self.output_file_var.trace_add('write', lambda *args: self._schedule_validation())
+        self._input_trace_id = ""
+        self._output_trace_id = ""
+        self._attach_path_traces()
 
         # 設定からデフォルトパスを読み込み
         self._load_default_paths()
 
+        # 画面の表示後、PDF処理モジュールをワーカーで先に読み込んでおく
+        self.tab.after_idle(lambda: self.run_in_background(self._warmup_pipeline))
+
+    def _warmup_pipeline(self) -> None:
+        """
+        PDF処理モジュールを事前にインポート（ワーカースレッドで実行）
+
+        _get_pdf_classesの結果はキャッシュされるため、初回のPDF統合で
+        インポートを待たずに済む。失敗しても実行時に改めてインポートしてエラーを表示する。
+        """
+        try:
+            _get_pdf_classes()
+        except Exception as e:
+            logger.debug(f"PDF処理モジュールの事前読み込みに失敗: {e}")
+
     def _create_ui(self) -> None:
         """UIを構築"""
+        fonts = _init_fonts(self.tab.winfo_toplevel())
+
         # スクロール可能なメインコンテナ（BaseTabの共通メソッドを使用）
         self.canvas, _scrollbar, self.scrollable_frame = self.create_scrollable_container()
 
@@ -78,7 +211,7 @@ class PDFTab(BaseTab):
         main_container = self.scrollable_frame
 
         # 使い方ガイド（初心者向け）
-        guide_frame = tk.LabelFrame(main_container, text="📖 使い方", font=("メイリオ", 10, "bold"))
+        guide_frame = tk.LabelFrame(main_container, text="📖 使い方", font=fonts.MEIRIO_10_BOLD)
         guide_frame.pack(fill="x", padx=PADDING['xlarge'], pady=(PADDING['large'], PADDING['medium']))
 
         guide_text = (
@@ -91,7 +224,7 @@ class PDFTab(BaseTab):
             guide_frame,
             text=guide_text,
             justify="left",
-            font=("メイリオ", 9),
+            font=fonts.MEIRIO_9,
             fg="#333",
             padx=15,
             pady=10
@@ -133,8 +266,10 @@ class PDFTab(BaseTab):
         create_tooltip(input_open_btn, UITooltips.TIP_FOLDER_OPEN)
 
         # 検証インジケーター
-        self.input_validation_label = tk.Label(form_frame, text="", font=("メイリオ", 10), width=2)
+        self.input_validation_label = tk.Label(form_frame, text="", font=fonts.MEIRIO_10, width=2)
         self.input_validation_label.grid(row=0, column=3, padx=(5, 15), pady=6)
+        # 検証のたびに作り直さず、表示する説明文だけを差し替える
+        self._input_validation_tip = create_tooltip(self.input_validation_label, "")
 
         # 出力ファイル選択
         tk.Label(form_frame, text="出力ファイル:", width=LABEL_WIDTH, anchor="e").grid(row=1, column=0, sticky="e", padx=(15, 5), pady=6)
@@ -154,15 +289,19 @@ class PDFTab(BaseTab):
         create_tooltip(output_open_btn, UITooltips.TIP_FOLDER_OPEN)
 
         # 検証インジケーター
-        self.output_validation_label = tk.Label(form_frame, text="", font=("メイリオ", 10), width=2)
+        self.output_validation_label = tk.Label(form_frame, text="", font=fonts.MEIRIO_10, width=2)
         self.output_validation_label.grid(row=1, column=3, padx=(5, 15), pady=6)
+        self._output_validation_tip = create_tooltip(self.output_validation_label, "")
 
         # 計画種別（自動判定結果の表示のみ）
         tk.Label(form_frame, text="計画種別:", width=LABEL_WIDTH, anchor="e").grid(row=2, column=0, sticky="e", padx=(15, 5), pady=6)
+        self.plan_type_text_var = tk.StringVar(value="自動判定中...")
+        # 表示中の判定結果 (計画種別, 確信度%)（同じ結果ならラベルを更新しない）
+        self._last_plan_display: Optional[Tuple[str, int]] = None
         self.plan_type_label = tk.Label(
             form_frame,
-            text="自動判定中...",
-            font=("メイリオ", 10),
+            textvariable=self.plan_type_text_var,
+            font=fonts.MEIRIO_10,
             fg="#666",
             anchor="w"
         )
@@ -180,7 +319,7 @@ class PDFTab(BaseTab):
             text="▶ PDF統合を実行",
             command=self._run_pdf_merge,
             color="primary",
-            font=("メイリオ", 11, "bold"),
+            font=fonts.MEIRIO_11_BOLD,
             width=28,
             height=2
         )
@@ -190,7 +329,7 @@ class PDFTab(BaseTab):
             button_frame,
             text="✕ キャンセル",
             command=self._cancel_operation,
-            font=("メイリオ", 10),
+            font=fonts.MEIRIO_10,
             bg="#f44336",
             fg="white",
             width=12,
@@ -200,26 +339,29 @@ class PDFTab(BaseTab):
         self.cancel_button.pack(side="left", padx=5)
 
         # ステータスラベル
-        self.status_label = tk.Label(main_container, text="", font=("メイリオ", 9), fg="gray")
+        self.status_label = tk.Label(main_container, text="", font=fonts.MEIRIO_9, fg="gray")
         self.status_label.pack()
 
         # プログレスバー
-        self.progress = ttk.Progressbar(main_container, mode='indeterminate')
+        self.progress = ttk.Progressbar(main_container, mode='determinate', maximum=100)
         self.progress.pack(fill="x", padx=20, pady=5)
 
-        # ログ表示
-        self.create_log_frame(height=10, parent=main_container)
-        # GUIログハンドラを設定（各モジュールのログをGUIに表示）
-        self.setup_gui_logging()
+        # ログ表示はフォームの表示後に作成（それまでのログはBaseTabが保持）
         self.log("準備完了。入力ディレクトリと出力ファイルを選択して実行してください。", "info")
+        self.tab.after_idle(lambda: self.create_log_frame(height=10, parent=main_container))
 
     def _select_input_dir(self) -> None:
         """入力ディレクトリを選択（pathlibベース）"""
         try:
             logger.info("ディレクトリ選択ダイアログを開きます")
 
+            dialog_options = {}
+            initial_dir = self._cached_dir(self._last_input_dir)
+            if initial_dir:
+                dialog_options['initialdir'] = str(initial_dir)
+
             # tkinterの標準ダイアログを使用（sys.coinit_flagsでフリーズ解決済み）
-            directory = filedialog.askdirectory(title="入力ディレクトリを選択")
+            directory = filedialog.askdirectory(title="入力ディレクトリを選択", **dialog_options)
 
             logger.info(f"ダイアログから戻りました: {directory if directory else 'キャンセル'}")
 
@@ -231,7 +373,12 @@ class PDFTab(BaseTab):
                 )
 
                 if is_valid and validated_path:
+                    self._last_input_dir = validated_path
+                    with self._validation_lock:
+                        self._validation_cache.clear()
+                    self._last_validated = None
                     self.input_dir_var.set(str(validated_path))
+                    self._validated_input = validated_path
                     self.update_status(f"入力ディレクトリを選択: {validated_path.name}")
                     logger.info(f"入力ディレクトリを選択: {validated_path}")
 
@@ -254,14 +401,13 @@ class PDFTab(BaseTab):
         try:
             logger.info("出力ファイル選択ダイアログを開きます")
 
-            # デフォルトの出力先をデスクトップに設定
-            desktop_path = Path.home() / "Desktop"
-            initial_dir = str(desktop_path) if desktop_path.exists() else str(Path.home())
+            # 前回の出力先を優先し、なければ入力欄などから初期ディレクトリを決定
+            initial_dir = self._cached_dir(self._last_output_dir) or self._output_initial_dir()
 
             # tkinterの標準ダイアログを使用（sys.coinit_flagsでフリーズ解決済み）
             file_path = filedialog.asksaveasfilename(
                 title="出力ファイルを選択",
-                initialdir=initial_dir,
+                initialdir=str(initial_dir),
                 initialfile="merged_output.pdf",
                 defaultextension=".pdf",
                 filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
@@ -278,11 +424,16 @@ class PDFTab(BaseTab):
                 )
 
                 if is_valid and validated_path:
+                    self._last_output_dir = validated_path.parent
+                    with self._validation_lock:
+                        self._validation_cache.clear()
+                    self._last_validated = None
                     self.output_file_var.set(str(validated_path))
+                    self._validated_output = validated_path
                     self.update_status(f"出力ファイルを選択: {validated_path.name}")
                     logger.info(f"出力ファイルを選択: {validated_path}")
-                    # 実行ボタンの状態を更新
-                    self._update_run_button_state()
+                    # 検証表示と実行ボタンの状態をすぐに更新
+                    self._validate_inputs()
                 else:
                     self._show_validation_error(error_msg)
             else:
@@ -295,6 +446,37 @@ class PDFTab(BaseTab):
                 f"出力ファイルの参照中にエラーが発生しました。\n\n詳細: {e}"
             )
 
+    @staticmethod
+    def _cached_dir(path: Optional[Path]) -> Optional[Path]:
+        """
+        記憶しているディレクトリがまだ存在すれば返す
+
+        ネットワークドライブではstatが遅いため、確認は1回のis_dir()のみ。
+        """
+        if path is not None and path.is_dir():
+            return path
+        return None
+
+    def _output_initial_dir(self) -> Path:
+        """
+        出力ファイル選択ダイアログの初期ディレクトリを決定
+
+        入力欄のファイルの親 → デスクトップ → ホームの順に、最初に存在するものを返す。
+        """
+        candidates = []
+        current = self.output_file_var.get().strip()
+        if current and current != UILabels.PLACEHOLDER_FILE:
+            candidates.append(Path(current).parent)
+        candidates.append(Path.home() / "Desktop")
+
+        try:
+            for candidate in candidates:
+                if candidate.is_dir():
+                    return candidate
+        except OSError as e:
+            logger.debug(f"初期ディレクトリの確認に失敗: {e}")
+        return Path.home()
+
     def _open_input_dir(self) -> None:
         """入力ディレクトリをエクスプローラーで開く"""
         dir_path = self.input_dir_var.get().strip()
@@ -341,18 +523,40 @@ class PDFTab(BaseTab):
 
     def _cancel_operation(self) -> None:
         """処理をキャンセル"""
-        self._cancel_event.set()
+        self._cancelled = True
+        # まだ開始前であればワーカーへの投入自体を取り消す
+        if self._task_future is not None:
+            self._task_future.cancel()
         self.log("キャンセルリクエストを送信しました...", "warning")
         self.update_status("キャンセル処理中...")
 
+    def shutdown_executor(self) -> None:
+        """
+        実行中のPDF統合・構造検出・入力検証にキャンセルを要求してからワーカーを停止
+
+        MAX_WORKERSが2のため、PDF統合と構造判定・検証が同時に実行されている場合がある。
+        """
+        self._cancelled = True
+        self._cancel_detection()
+        # 入力検証は未開始なら取り消し、実行中なら結果を表示しない
+        if self._validation_future is not None:
+            self._validation_future.cancel()
+            self._validation_future = None
+        self._validation_generation += 1
+        super().shutdown_executor()
+
     def _is_cancelled(self) -> bool:
-        """キャンセル状態を返す（コールバック用、スレッドセーフ）"""
-        return self._cancel_event.is_set()
+        """キャンセル状態を返す（cancel_checkコールバック用）"""
+        return self._cancelled
 
     def _run_pdf_merge(self) -> None:
         """PDF統合を実行（pathlibベース、2025年ベストプラクティス準拠）"""
         logger.info("PDF統合実行ボタンがクリックされました")
 
+        if self.is_task_running():
+            logger.info("PDF統合は既に実行中です")
+            return
+
         # 入力値の取得
         input_dir_str = self.input_dir_var.get()
         output_file_str = self.output_file_var.get()
@@ -366,64 +570,52 @@ class PDFTab(BaseTab):
             messagebox.showerror("入力エラー", "入力ディレクトリと出力ファイルの両方を指定してください。")
             return
 
-        # 入力ディレクトリの検証
-        is_valid_dir, error_msg_dir, input_dir_path = PathValidator.validate_directory(
-            input_dir_str,
-            must_exist=True
-        )
-
-        if not is_valid_dir or not input_dir_path:
-            logger.error(f"入力ディレクトリの検証エラー: {error_msg_dir}")
-            messagebox.showerror("パスエラー", error_msg_dir or "入力ディレクトリが無効です")
-            return
+        # 入力ディレクトリの検証（ダイアログで検証済みで、その後変更されていなければ省略）
+        input_dir_path = self._validated_input
+        if input_dir_path is None or str(input_dir_path) != input_dir_str:
+            is_valid_dir, error_msg_dir, input_dir_path = PathValidator.validate_directory(
+                input_dir_str,
+                must_exist=True
+            )
 
-        # 出力ファイルの検証
-        is_valid_file, error_msg_file, output_file_path = PathValidator.validate_file_path(
-            output_file_str,
-            must_exist=False,
-            allowed_extensions=['.pdf']
-        )
+            if not is_valid_dir or not input_dir_path:
+                logger.error(f"入力ディレクトリの検証エラー: {error_msg_dir}")
+                messagebox.showerror("パスエラー", error_msg_dir or "入力ディレクトリが無効です")
+                return
+
+        # 出力ファイルの検証（同上）
+        output_file_path = self._validated_output
+        if output_file_path is None or str(output_file_path) != output_file_str:
+            is_valid_file, error_msg_file, output_file_path = PathValidator.validate_file_path(
+                output_file_str,
+                must_exist=False,
+                allowed_extensions=['.pdf']
+            )
 
-        if not is_valid_file or not output_file_path:
-            logger.error(f"出力ファイルの検証エラー: {error_msg_file}")
-            messagebox.showerror("パスエラー", error_msg_file or "出力ファイルパスが無効です")
-            return
+            if not is_valid_file or not output_file_path:
+                logger.error(f"出力ファイルの検証エラー: {error_msg_file}")
+                messagebox.showerror("パスエラー", error_msg_file or "出力ファイルパスが無効です")
+                return
 
         logger.info(f"パス検証完了 - 入力: {input_dir_path}, 出力: {output_file_path}")
 
         # キャンセルフラグをリセット
-        self._cancel_event.clear()
+        self._cancelled = False
+
+        # GUIログハンドラを設定（変換処理モジュールのログをGUIに表示、初回実行時のみ）
+        self.setup_gui_logging()
+
+        # 開始時のUI更新はメインスレッド上でまとめて行う（ワーカーからの個別ポストを削減）
+        set_button_state(self.run_button, False, self.status_label, "🔄 実行中...")
+        self.cancel_button.config(state="normal")
+        self.progress.configure(value=0)
+        self.update_status("PDF統合を実行中...")
 
         def task():
-            ichitaro_dialog = None
-
-            def dialog_callback(message: str, show: bool):
-                """一太郎変換ダイアログの表示/非表示"""
-                nonlocal ichitaro_dialog
-
-                def _handle():
-                    nonlocal ichitaro_dialog
-                    if show:
-                        if not ichitaro_dialog:
-                            ichitaro_dialog = IchitaroConversionDialog(
-                                self.tab,
-                                cancel_callback=self._cancel_operation
-                            )
-                        ichitaro_dialog.update_message(message)
-                    else:
-                        if ichitaro_dialog:
-                            ichitaro_dialog.close()
-                            ichitaro_dialog = None
-
-                thread_safe_call(self.tab, _handle)
+            result_dialog: Optional[Callable[[], Any]] = None
+            status_text = ""
 
             try:
-                # GUI操作はすべてスレッドセーフに実行
-                set_button_state(self.run_button, False, self.status_label, "🔄 実行中...")
-                thread_safe_call(self.tab, lambda: self.cancel_button.config(state="normal"))
-                thread_safe_call(self.tab, lambda: self.progress.start(10))
-                self.update_status("PDF統合を実行中...")
-
                 self.log("=== PDF統合開始 ===", "info")
                 self.log(f"入力: {input_dir_path}")
                 self.log(f"出力: {output_file_path}")
@@ -440,69 +632,141 @@ class PDFTab(BaseTab):
                 self.log("設定を読み込み中...", "info")
                 ichitaro_settings = self.config.get('ichitaro')
 
-                self.log("PDFコンバーターを初期化中...", "info")
-                converter = PDFConverter(
-                    temp_dir,
-                    ichitaro_settings,
-                    cancel_check=self._is_cancelled,
-                    dialog_callback=dialog_callback,
-                    config=self.config
-                )
+                PDFConverter, PDFProcessor, DocumentCollector, PDFMergeOrchestrator = _get_pdf_classes()
 
                 self.log("PDFプロセッサーを初期化中...", "info")
-                processor = PDFProcessor(self.config)
-
-                self.log("ドキュメントコレクターを初期化中...", "info")
-                collector = DocumentCollector(
-                    converter, processor,
-                    cancel_check=self._is_cancelled
-                )
-
-                self.log("オーケストレーターを初期化中...", "info")
-                orchestrator = PDFMergeOrchestrator(
-                    self.config, converter, processor, collector,
-                    cancel_check=self._is_cancelled
-                )
+                processor = self._get_pdf_processor(PDFProcessor)
+
+                pipeline_key = (processor, temp_dir, dict(ichitaro_settings or {}))
+                if self._pipeline is None or self._pipeline_key != pipeline_key:
+                    self.log("PDFコンバーターを初期化中...", "info")
+                    converter = PDFConverter(
+                        temp_dir,
+                        ichitaro_settings,
+                        cancel_check=self._is_cancelled,
+                        dialog_callback=self._on_ichitaro_dialog,
+                        config=self.config,
+                        pdf_processor=processor
+                    )
+
+                    self.log("ドキュメントコレクターを初期化中...", "info")
+                    collector = DocumentCollector(
+                        converter, processor,
+                        cancel_check=self._is_cancelled
+                    )
+
+                    self.log("オーケストレーターを初期化中...", "info")
+                    orchestrator = PDFMergeOrchestrator(
+                        self.config, converter, processor, collector,
+                        cancel_check=self._is_cancelled,
+                        progress_callback=self._report_merge_progress
+                    )
+                    self._pipeline = (converter, collector, orchestrator)
+                    self._pipeline_key = pipeline_key
+                else:
+                    self.log("前回の初期化済みコンポーネントを再利用します", "info")
+                orchestrator = self._pipeline[2]
 
                 self.log("PDF統合処理を開始します...", "info")
                 create_separators = (plan_type == "education")
                 orchestrator.create_merged_pdf(input_dir_str_final, output_file_str_final, create_separators)
 
                 self.log("=== PDF統合完了 ===", "success")
-                set_button_state(self.run_button, True, self.status_label, "✅ 完了")
                 self.update_status("PDF統合が完了しました")
-                thread_safe_call(self.tab, lambda: messagebox.showinfo(
+                status_text = "✅ 完了"
+                result_dialog = partial(
+                    messagebox.showinfo,
                     "完了", f"PDF統合が完了しました！\n\n出力ファイル:\n{output_file_path}"
-                ))
+                )
 
             except CancelledError:
                 self.log("=== キャンセルされました ===", "warning")
-                set_button_state(self.run_button, True, self.status_label, "⚠️ キャンセル")
                 self.update_status("PDF統合がキャンセルされました")
+                status_text = "⚠️ キャンセル"
             except Exception as e:
                 self.log(f"エラー: {e}", "error")
-                set_button_state(self.run_button, True, self.status_label, "❌ エラー")
                 self.update_status("PDF統合でエラーが発生しました")
-                # スレッドセーフにダイアログを表示
-                error_msg = str(e)
-                thread_safe_call(self.tab, lambda: messagebox.showerror(
-                    "実行エラー", f"PDF統合中にエラーが発生しました。\n\n詳細:\n{error_msg}"
-                ))
+                status_text = "❌ エラー"
+                result_dialog = partial(
+                    messagebox.showerror,
+                    "実行エラー", f"PDF統合中にエラーが発生しました。\n\n詳細:\n{e}"
+                )
             finally:
-                def _cleanup():
-                    try:
-                        self.progress.stop()
-                        self.cancel_button.config(state="disabled")
-                    except Exception:
-                        pass
-                thread_safe_call(self.tab, _cleanup)
+                # 終了時のUI更新（ボタン・プログレスバー・一太郎ダイアログ・結果表示）を1回のポストで行う
+                def _finish():
+                    self._reset_merge_ui(status_text)
+                    self._close_ichitaro_dialog()
+                    if result_dialog:
+                        result_dialog()
+                thread_safe_call(self.tab, _finish)
+
+        future = self.submit_task(task)
+        if future is not None:
+            future.add_done_callback(self._on_merge_future_done)
+
+    def _on_ichitaro_dialog(self, message: str, show: bool) -> None:
+        """一太郎変換ダイアログの表示/非表示（コンバーターのワーカースレッドから呼ばれる）"""
+        def _handle():
+            if show:
+                if not self._ichitaro_dialog:
+                    self._ichitaro_dialog = IchitaroConversionDialog(
+                        self.tab,
+                        cancel_callback=self._cancel_operation
+                    )
+                self._ichitaro_dialog.update_message(message)
+            else:
+                self._close_ichitaro_dialog()
+
+        thread_safe_call(self.tab, _handle)
+
+    def _close_ichitaro_dialog(self) -> None:
+        """一太郎変換ダイアログを閉じる（UIスレッドで実行）"""
+        if self._ichitaro_dialog:
+            self._ichitaro_dialog.close()
+            self._ichitaro_dialog = None
+
+    def _on_merge_future_done(self, future: "Future[Any]") -> None:
+        """開始前にキャンセルされた場合は、taskのfinallyが走らないためここでUIを戻す"""
+        if not future.cancelled():
+            return
+
+        self.log("=== キャンセルされました ===", "warning")
+        thread_safe_call(self.tab, partial(self._reset_merge_ui, "⚠️ キャンセル"))
 
-                # ダイアログが残っていたら閉じる
-                if ichitaro_dialog:
-                    thread_safe_call(self.tab, lambda: ichitaro_dialog.close())
+    def _report_merge_progress(self, completed_steps: int, total_steps: int) -> None:
+        """オーケストレーターの進捗をプログレスバーに反映（ワーカースレッドから呼ばれる）"""
+        value = completed_steps * 100 // total_steps
+        thread_safe_call(self.tab, lambda: self.progress.configure(value=value))
 
-        thread = threading.Thread(target=task, daemon=True)
-        thread.start()
+    def _reset_merge_ui(self, status_text: str) -> None:
+        """
+        PDF統合終了後にボタンを待機状態へ戻す（UIスレッドで実行、プログレスバーは最終位置のまま）
+
+        Args:
+            status_text: 実行ボタン横に表示する結果（"✅ 完了" など）
+        """
+        try:
+            self.cancel_button.config(state="disabled")
+        except tk.TclError:
+            pass  # ウィジェットが破棄されている場合は無視
+        set_button_state(self.run_button, True, self.status_label, status_text)
+
+    def _get_pdf_processor(self, processor_cls: Type["PDFProcessor"]) -> "PDFProcessor":
+        """
+        PDFProcessorを取得（前回の実行時から設定が変わっていなければ再利用）
+
+        PDFProcessorは生成時に明朝フォントを読み込んで登録するため、
+        設定の再読み込みやフォントパスの変更があった場合のみ作り直す。
+        """
+        font_path = self.config.get('fonts', 'mincho')
+        if (
+            self._pdf_processor is None
+            or self._pdf_processor.config is not self.config
+            or self._pdf_processor_font != font_path
+        ):
+            self._pdf_processor = processor_cls(self.config)
+            self._pdf_processor_font = font_path
+        return self._pdf_processor
 
     def _detect_and_set_plan_type_async(self, directory_path: Path) -> None:
         """
@@ -511,31 +775,60 @@ class PDFTab(BaseTab):
         Args:
             directory_path: 判定対象のディレクトリPath
         """
+        def apply_result(result: DetectionResult) -> None:
+            """判定結果をUIに反映（UIスレッドで実行）"""
+            try:
+                if result.plan_type == PlanType.AMBIGUOUS:
+                    # 判定が曖昧な場合はダイアログで確認
+                    self._show_plan_type_selection_dialog(result)
+                else:
+                    # 確定判定の場合は自動設定
+                    self.plan_type_var.set(result.plan_type.value)
+                    self._update_plan_type_display(result)
+            except Exception as ui_error:
+                logger.error(f"UI更新エラー: {ui_error}", exc_info=True)
+
+        # 前回の判定がまだ実行中なら中断する（古い結果で上書きされないように）
+        self._cancel_detection()
+
+        # 同じフォルダを再選択した場合は前回の判定結果を使う（更新時刻が変わっていれば再判定）
+        try:
+            cache_key = (str(directory_path), directory_path.stat().st_mtime_ns)
+        except OSError:
+            cache_key = None
+        cached = self._detection_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            self._detection_cache.move_to_end(cache_key)
+            logger.debug(f"フォルダ構造判定のキャッシュを使用: {directory_path}")
+            self.tab.after(0, lambda: apply_result(cached))
+            return
+
         # ステータス更新
         self.update_status("フォルダ構造を自動判定中...")
 
+        cancel_event = threading.Event()
+
         def task():
             try:
-                from folder_structure_detector import FolderStructureDetector, PlanType
-
-                detector = FolderStructureDetector()
-                result = detector.detect_structure(str(directory_path))
+                result = self._detector.detect_structure(
+                    str(directory_path), cancel_check=cancel_event.is_set
+                )
 
-                # UIスレッドで結果を反映
+                # UIスレッドで結果を反映（キャッシュの更新もUIスレッドで行う）
                 def update_ui():
-                    try:
-                        if result.plan_type == PlanType.AMBIGUOUS:
-                            # 判定が曖昧な場合はダイアログで確認
-                            self._show_plan_type_selection_dialog(result)
-                        else:
-                            # 確定判定の場合は自動設定
-                            self.plan_type_var.set(result.plan_type.value)
-                            self._update_plan_type_display(result)
-                    except Exception as ui_error:
-                        logger.error(f"UI更新エラー: {ui_error}", exc_info=True)
+                    if cancel_event.is_set():
+                        return  # 反映前に別のフォルダが選択された
+                    if cache_key:
+                        self._detection_cache[cache_key] = result
+                        while len(self._detection_cache) > self.DETECTION_CACHE_SIZE:
+                            self._detection_cache.popitem(last=False)
+                    apply_result(result)
 
                 self.tab.after(0, update_ui)
 
+            except CancelledError:
+                logger.debug(f"フォルダ構造判定を中断しました: {directory_path}")
+
             except Exception as e:
                 logger.error(f"フォルダ構造判定エラー: {e}", exc_info=True)
                 # エラー時はデフォルト動作（手動選択のまま）
@@ -543,9 +836,18 @@ class PDFTab(BaseTab):
                     self.update_status("フォルダ構造の自動判定をスキップしました")
                 self.tab.after(0, show_error)
 
-        # バックグラウンドスレッドで実行
-        thread = threading.Thread(target=task, daemon=True, name="FolderStructureDetection")
-        thread.start()
+        # タブのワーカーで実行（PDF統合と同じスケジューラを共有）
+        self._detect_cancel_event = cancel_event
+        self._detect_future = self.run_in_background(task)
+
+    def _cancel_detection(self) -> None:
+        """実行中（または待機中）のフォルダ構造判定をキャンセル"""
+        if self._detect_future is not None and not self._detect_future.done():
+            self._detect_future.cancel()
+        if self._detect_cancel_event is not None:
+            self._detect_cancel_event.set()
+        self._detect_future = None
+        self._detect_cancel_event = None
 
     def _update_plan_type_display(self, result) -> None:
         """
@@ -561,11 +863,11 @@ class PDFTab(BaseTab):
         icon = "📚" if result.plan_type.value == "education" else "📅"
 
         # UIラベルを更新
-        if hasattr(self, 'plan_type_label'):
-            self.plan_type_label.config(
-                text=f"{icon} {plan_name} (確信度: {confidence_pct}%)",
-                fg="#2196F3" if confidence_pct >= 70 else "#FF9800"
-            )
+        display_key = (result.plan_type.value, confidence_pct)
+        if hasattr(self, 'plan_type_label') and display_key != self._last_plan_display:
+            self._last_plan_display = display_key
+            self.plan_type_text_var.set(f"{icon} {plan_name} (確信度: {confidence_pct}%)")
+            self.plan_type_label.config(fg="#2196F3" if confidence_pct >= 70 else "#FF9800")
 
         # ステータスバーにも表示
         message = f"計画種別を自動判定: {plan_name} (確信度: {confidence_pct}%)"
@@ -604,78 +906,220 @@ class PDFTab(BaseTab):
             entry.config(fg='gray')
             entry.insert(0, placeholder)
 
+    def _on_input_dir_changed(self, *_trace_args: Any) -> None:
+        """入力ディレクトリ欄の変更時: 検証済みマークをクリアして再検証を予約"""
+        self._validated_input = None
+        self._schedule_validation()
+
+    def _on_output_file_changed(self, *_trace_args: Any) -> None:
+        """出力ファイル欄の変更時: 検証済みマークをクリアして再検証を予約"""
+        self._validated_output = None
+        self._schedule_validation()
+
+    def _attach_path_traces(self) -> None:
+        """入力・出力欄の変更監視を登録（解除用にIDを保持）"""
+        # トレースの引数 (name, index, mode) はハンドラ側で読み捨てる
+        self._input_trace_id = self.input_dir_var.trace_add('write', self._on_input_dir_changed)
+        self._output_trace_id = self.output_file_var.trace_add('write', self._on_output_file_changed)
+
+    def _detach_path_traces(self) -> None:
+        """入力・出力欄の変更監視を一時的に解除"""
+        self.input_dir_var.trace_remove('write', self._input_trace_id)
+        self.output_file_var.trace_remove('write', self._output_trace_id)
+
     def _schedule_validation(self) -> None:
         """検証処理をスケジュール（デバウンス処理）"""
-        # 既存のタイマーをキャンセル
+        # 予約済みの検証があればそれにまとめる（同じタイミングの複数の変更で二重に予約しない）
         if self._validation_timer is not None:
-            self.tab.after_cancel(self._validation_timer)
-
-        # 300ms後に検証を実行（ユーザーの入力が落ち着いてから）
-        self._validation_timer = self.tab.after(300, self._validate_inputs)
+            return
+        # プレースホルダーの出し入れなど、検証対象が変わらない書き込みでは予約しない
+        if self._current_validation_key() == self._last_validated:
+            return
 
-    def _validate_inputs(self) -> None:
-        """入力フィールドの検証とビジュアルフィードバック"""
-        # 入力ディレクトリの検証
-        input_path = self.input_dir_var.get()
-        if input_path and input_path != UILabels.PLACEHOLDER_DIR:
-            is_valid, error_msg, validated_path = PathValidator.validate_directory(input_path, must_exist=True)
-            if is_valid:
-                self.input_validation_label.config(text=UIIcons.ICON_SUCCESS, fg=UIColors.VALID)
-                create_tooltip(self.input_validation_label, "入力ディレクトリが存在します")
-            else:
-                self.input_validation_label.config(text=UIIcons.ICON_ERROR, fg=UIColors.INVALID)
-                create_tooltip(self.input_validation_label, error_msg)
+        # ユーザーの入力が落ち着いてから検証を実行
+        # 検証が軽ければ短く、ネットワークドライブ等で重ければ長く待つ（平均コストの2倍）
+        if self._validation_costs:
+            average_cost = sum(self._validation_costs) / len(self._validation_costs)
+            delay = int(2 * average_cost * 1000)
         else:
-            self.input_validation_label.config(text="", fg='black')
+            delay = self.VALIDATION_DELAY_DEFAULT_MS
+        delay = max(self.VALIDATION_DELAY_MIN_MS, min(self.VALIDATION_DELAY_MAX_MS, delay))
+        self._validation_timer = self.tab.after(delay, self._validate_inputs)
 
-        # 出力ファイルの検証
+    def _current_validation_key(self) -> Tuple[str, str]:
+        """検証対象の (入力パス, 出力パス) を返す（プレースホルダーは未入力として空文字に揃える）"""
+        input_path = self.input_dir_var.get()
         output_path = self.output_file_var.get()
-        if output_path and output_path != UILabels.PLACEHOLDER_FILE:
-            is_valid, error_msg, validated_path = PathValidator.validate_file_path(output_path, must_exist=False, allowed_extensions=['.pdf'])
-            if is_valid:
-                self.output_validation_label.config(text=UIIcons.ICON_SUCCESS, fg=UIColors.VALID)
-                create_tooltip(self.output_validation_label, "出力先のパスが有効です")
-            else:
-                self.output_validation_label.config(text=UIIcons.ICON_ERROR, fg=UIColors.INVALID)
-                create_tooltip(self.output_validation_label, error_msg)
-        else:
-            self.output_validation_label.config(text="", fg='black')
+        if input_path == UILabels.PLACEHOLDER_DIR:
+            input_path = ""
+        if output_path == UILabels.PLACEHOLDER_FILE:
+            output_path = ""
+        return input_path, output_path
 
-        # 実行ボタンの有効/無効を更新
-        self._update_run_button_state()
+    def _validate_inputs(self) -> None:
+        """
+        入力フィールドの検証を開始（検証はワーカーで行い、結果はメインスレッドで表示）
 
-    def _update_run_button_state(self) -> None:
-        """実行ボタンの状態を更新"""
-        input_path = self.input_dir_var.get()
-        output_path = self.output_file_var.get()
+        ネットワークドライブ上のパスではstatに時間がかかるため、UIスレッドでは検証しない。
+        新しい検証を開始したら、それより前の検証結果は表示しない。
+        """
+        # 直接呼ばれた場合は予約済みの検証が不要になる
+        if self._validation_timer is not None:
+            self.tab.after_cancel(self._validation_timer)
+            self._validation_timer = None
 
-        logger.debug(f"実行ボタン状態チェック: input={input_path}, output={output_path}")
+        # 値が変わらない書き込み（プレースホルダーの出し入れなど）では検証し直さない
+        validation_key = self._current_validation_key()
+        if validation_key == self._last_validated:
+            return
+        self._last_validated = validation_key
+        input_path, output_path = validation_key
+
+        # 未開始の古い検証は取り消す（実行中のものは結果を捨てる）
+        if self._validation_future is not None:
+            self._validation_future.cancel()
+        self._validation_generation += 1
+        generation = self._validation_generation
+
+        future = self.run_in_background(partial(self._run_validation, input_path, output_path))
+        self._validation_future = future
+        future.add_done_callback(
+            lambda f: thread_safe_call(self.tab, partial(self._apply_validation_result, generation, f))
+        )
 
-        # 両方が入力されており、プレースホルダーでない場合のみ有効
-        if (input_path and input_path != UILabels.PLACEHOLDER_DIR and
-            output_path and output_path != UILabels.PLACEHOLDER_FILE):
-            # さらに実際にパスが有効かチェック
-            input_valid, input_err, _ = PathValidator.validate_directory(input_path, must_exist=True)
-            output_valid, output_err, _ = PathValidator.validate_file_path(output_path, must_exist=False, allowed_extensions=['.pdf'])
+    def _run_validation(self, input_path: str, output_path: str) -> Tuple[
+        Optional[Tuple[bool, Optional[str], Optional[Path]]],
+        Optional[Tuple[bool, Optional[str], Optional[Path]]],
+        float
+    ]:
+        """
+        入力・出力パスを検証（ワーカースレッドで実行）
+
+        Returns:
+            (入力ディレクトリの検証結果, 出力ファイルの検証結果, 検証にかかった秒数)
+            未入力の欄の検証結果はNone
+        """
+        started = time.perf_counter()
+        # 出力先の親フォルダが入力フォルダと同じ場合などに、同じパスを2回statしない
+        stat_cache: StatCache = {}
+        input_result = self._cached_validate('dir', input_path, stat_cache=stat_cache) if input_path else None
+        output_result = self._cached_validate('pdf', output_path, stat_cache=stat_cache) if output_path else None
+        return input_result, output_result, time.perf_counter() - started
+
+    def _apply_validation_result(self, generation: int, future: "Future[Any]") -> None:
+        """検証結果をアイコンと実行ボタンに反映（メインスレッドで実行）"""
+        if future.cancelled():
+            return
+        try:
+            input_result, output_result, cost = future.result()
+        except Exception as e:
+            logger.error(f"入力欄の検証に失敗: {e}", exc_info=True)
+            return
 
-            logger.debug(f"パス検証結果: input_valid={input_valid}, output_valid={output_valid}")
-            if not input_valid:
-                logger.debug(f"入力パス検証エラー: {input_err}")
-            if not output_valid:
-                logger.debug(f"出力パス検証エラー: {output_err}")
+        # デバウンス間隔の調整用（_schedule_validationと同じメインスレッドで記録する）
+        self._validation_costs.append(cost)
+        if generation != self._validation_generation:
+            return  # より新しい検証が開始されている
 
-            if input_valid and output_valid:
-                logger.info("実行ボタンを有効化")
-                self.run_button.config(state='normal')
+        try:
+            # 入力ディレクトリの検証
+            input_valid = False
+            if input_result is not None:
+                input_valid, error_msg, _ = input_result
+                if input_valid:
+                    self.input_validation_label.config(text=UIIcons.ICON_SUCCESS, fg=UIColors.VALID)
+                    self._input_validation_tip.text = "入力ディレクトリが存在します"
+                else:
+                    self.input_validation_label.config(text=UIIcons.ICON_ERROR, fg=UIColors.INVALID)
+                    self._input_validation_tip.text = error_msg or ""
+            else:
+                self.input_validation_label.config(text="", fg='black')
+                self._input_validation_tip.text = ""
+
+            # 出力ファイルの検証
+            output_valid = False
+            if output_result is not None:
+                output_valid, error_msg, _ = output_result
+                if output_valid:
+                    self.output_validation_label.config(text=UIIcons.ICON_SUCCESS, fg=UIColors.VALID)
+                    self._output_validation_tip.text = "出力先のパスが有効です"
+                else:
+                    self.output_validation_label.config(text=UIIcons.ICON_ERROR, fg=UIColors.INVALID)
+                    self._output_validation_tip.text = error_msg or ""
             else:
-                logger.warning(f"実行ボタンを無効化: input_valid={input_valid}, output_valid={output_valid}")
-                self.run_button.config(state='disabled')
+                self.output_validation_label.config(text="", fg='black')
+                self._output_validation_tip.text = ""
+
+            # 実行ボタンの有効/無効を更新（上の検証結果をそのまま使う）
+            self._update_run_button_state(input_valid, output_valid)
+        except tk.TclError:
+            pass  # ウィジェットが破棄されている場合は無視
+
+    def _cached_validate(
+        self, kind: str, path_str: str,
+        path_stat: Optional[os.stat_result] = None,
+        stat_cache: Optional[StatCache] = None
+    ) -> Tuple[bool, Optional[str], Optional[Path]]:
+        """
+        入力欄のパスを検証（直近の同じ検証結果があれば再利用）
+
+        同じパスの検証が短時間に繰り返されるため（デフォルトパス設定直後の検証、
+        デバウンス後の再検証など）、VALIDATION_CACHE_TTL 秒以内の結果はファイルシステムに問い合わせず返す。
+
+        Args:
+            kind: 'dir'（入力ディレクトリ）または 'pdf'（出力PDFファイル）
+            path_str: 検証するパス文字列
+            path_stat: 'dir'の場合に、呼び出し側で取得済みのstat結果
+            stat_cache: 同じ検証で行う他のパスの検証とstat結果を共有する辞書
+
+        Returns:
+            PathValidatorと同じ (is_valid, error_msg, validated_path)
+        """
+        key = (kind, path_str)
+        now = time.monotonic()
+        with self._validation_lock:
+            cached = self._validation_cache.get(key)
+        if cached is not None and now - cached[0] < self.VALIDATION_CACHE_TTL:
+            return cached[1]
+
+        if kind == 'dir':
+            result = PathValidator.validate_directory(
+                path_str, must_exist=True, path_stat=path_stat, stat_cache=stat_cache
+            )
+        else:
+            result = PathValidator.validate_file_path(
+                path_str, must_exist=False, allowed_extensions=['.pdf'], stat_cache=stat_cache
+            )
+        # 入力中のパスごとにエントリが増えるため、期限切れのものを捨ててから登録
+        with self._validation_lock:
+            self._validation_cache = {
+                k: v for k, v in self._validation_cache.items()
+                if now - v[0] < self.VALIDATION_CACHE_TTL
+            }
+            self._validation_cache[key] = (now, result)
+        return result
+
+    def _update_run_button_state(self, input_valid: bool, output_valid: bool) -> None:
+        """
+        実行ボタンの状態を更新
+
+        Args:
+            input_valid: 入力ディレクトリが有効か（_validate_inputsの検証結果）
+            output_valid: 出力ファイルが有効か（同上）
+        """
+        # 入力のたびに呼ばれるため、DEBUG無効時はログ文字列の組み立て自体を省く
+        if input_valid and output_valid:
+            logger.debug("実行ボタンを有効化")
+            self.run_button.config(state='normal')
         else:
-            logger.warning(f"実行ボタンを無効化: 入力が不十分 (input={bool(input_path)}, output={bool(output_path)})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"実行ボタンを無効化: input_valid={input_valid}, output_valid={output_valid}")
             self.run_button.config(state='disabled')
 
     def _load_default_paths(self) -> None:
         """設定からデフォルトパスを読み込む"""
+        # 設定後にまとめて1回だけ検証するため、変更監視を一時的に外す
+        self._detach_path_traces()
         try:
             # 設定からGoogle Driveのベースパスを取得
             base_paths = self.config.get("base_paths") or {}
@@ -699,9 +1143,15 @@ class PDFTab(BaseTab):
                         # フルパスを構築
                         default_input_path = Path(google_drive_base) / year / education_plan_base / education_plan
 
-                        # パスが存在する場合のみ設定
-                        if default_input_path.exists():
+                        # ディレクトリが存在する場合のみ設定
+                        # （statの結果を検証キャッシュに渡し、直後の検証でstatし直さない）
+                        try:
+                            input_st: Optional[os.stat_result] = default_input_path.stat()
+                        except OSError:
+                            input_st = None
+                        if input_st is not None and stat.S_ISDIR(input_st.st_mode):
                             self.input_dir_var.set(str(default_input_path))
+                            self._cached_validate('dir', str(default_input_path), path_stat=input_st)
                             logger.info(f"デフォルト入力ディレクトリを設定: {default_input_path}")
 
             # 出力ファイルが未設定の場合、デスクトップのデフォルトファイル名を設定
@@ -710,13 +1160,21 @@ class PDFTab(BaseTab):
                 output_config = self.config.get("output") or {}
                 default_output_file = output_config.get("merged_pdf", "merged_output.pdf")
 
-                if desktop_path.exists():
+                try:
+                    desktop_exists = stat.S_ISDIR(desktop_path.stat().st_mode)
+                except OSError:
+                    desktop_exists = False
+                if desktop_exists:
                     default_output_path = desktop_path / default_output_file
                     self.output_file_var.set(str(default_output_path))
                     logger.info(f"デフォルト出力ファイルを設定: {default_output_path}")
 
         except Exception as e:
             logger.warning(f"デフォルトパスの読み込みに失敗: {e}", exc_info=True)
+        finally:
+            self._attach_path_traces()
+
+        self._validate_inputs()
 
     def _show_validation_error(self, error_msg: Optional[str]) -> None:
         """
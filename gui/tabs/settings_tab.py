@@ -6,11 +6,16 @@
 import logging
 import os
 import threading
+import time
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from typing import Any, Callable, Optional
+from concurrent.futures import Future
+from datetime import date
+from functools import partial
+from tkinter import ttk, filedialog, messagebox, simpledialog
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+from ghostscript_utils import GhostscriptManager
 from gui.tabs.base_tab import BaseTab
 from gui.utils import create_hover_button, open_file_or_folder, thread_safe_call
 from path_validator import PathValidator
@@ -18,10 +23,126 @@ from year_utils import calculate_year_short
 
 logger = logging.getLogger(__name__)
 
+# UIの固定文言・フォント・レイアウト値
+_HELP_TEXT = (
+    "このタブでは、アプリケーションの基本設定を行います。\n\n"
+    "📁 = フォルダを選択　│　📂 = フォルダを開く\n"
+    "📄 = ファイルを選択　│　🔍 = 自動検索\n\n"
+    "⚠️ 設定を変更したら、必ず「💾 保存」ボタンをクリックしてください。"
+)
+_FONT_BOLD_10 = ("メイリオ", 10, "bold")
+_FONT_BOLD_9 = ("メイリオ", 9, "bold")
+_FONT_10 = ("メイリオ", 10)
+_FONT_9 = ("メイリオ", 9)
+_FONT_8 = ("メイリオ", 8)
+_LABEL_WIDTH = 16  # 設定項目名ラベルの幅
+_PAD_Y = 5
+
+# 参照ダイアログの初期フォルダとして確認してよいローカルドライブ
+_LOCAL_DRIVES = frozenset(('C:', 'D:', 'E:'))
+
+# パスの存在確認結果のキャッシュ: パス -> (確認時刻, 存在するか)
+# Ghostscriptのパスは起動時・再読み込み時に続けて確認されるため、短時間の結果は再利用する
+_EXISTS_CACHE_TTL = 2.0
+_exists_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def _cached_exists(path: str, ttl: float = _EXISTS_CACHE_TTL) -> bool:
+    """
+    os.path.existsの結果をttl秒間キャッシュして返す
+
+    Args:
+        path: 確認するパス
+        ttl: キャッシュの有効期間（秒）
+
+    Returns:
+        bool: パスが存在するか
+    """
+    now = time.monotonic()
+    cached = _exists_cache.get(path)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    exists = os.path.exists(path)
+    _exists_cache[path] = (now, exists)
+    return exists
+
+
+def _set_exists_cache(path: str, exists: bool) -> None:
+    """ユーザー操作や自動検出で確認済みのパスの存在状態を登録"""
+    _exists_cache[path] = (time.monotonic(), exists)
+
+
+# Ghostscriptの動作確認結果のキャッシュ: (パス, 更新時刻) -> 動作したか
+# 確認はgs.exeの起動を伴うため、同じ実行ファイルには結果を再利用する（自動検出時に破棄）
+_gs_verify_cache: Dict[Tuple[str, float], bool] = {}
+
+
+def _gs_verify_key(gs_path: str) -> Optional[Tuple[str, float]]:
+    """動作確認キャッシュのキー（ファイルが存在しない場合はNone）"""
+    try:
+        return (gs_path, os.stat(gs_path).st_mtime)
+    except OSError:
+        return None
+
+
+def _cached_gs_verification(gs_path: str) -> Optional[bool]:
+    """
+    キャッシュ済みの動作確認結果を返す（gs.exeは起動しない）
+
+    Args:
+        gs_path: Ghostscriptの実行ファイルパス
+
+    Returns:
+        Optional[bool]: 確認済みならその結果、未確認ならNone（ファイルがなければFalse）
+    """
+    key = _gs_verify_key(gs_path)
+    if key is None:
+        return False
+    return _gs_verify_cache.get(key)
+
+
+def _verify_ghostscript_cached(gs_path: str) -> bool:
+    """
+    GhostscriptManager.verify_ghostscriptの結果を実行ファイルの更新時刻ごとにキャッシュして返す
+
+    Args:
+        gs_path: Ghostscriptの実行ファイルパス
+
+    Returns:
+        bool: 正常に動作する場合True
+    """
+    key = _gs_verify_key(gs_path)
+    if key is None:
+        return False
+    cached = _gs_verify_cache.get(key)
+    if cached is None:
+        cached = GhostscriptManager.verify_ghostscript(gs_path)
+        _gs_verify_cache[key] = cached
+    return cached
+
+
+# 今日の日付とそのログファイル名（日付が変わったときだけ作り直す）
+_today_log_cache: Optional[Tuple[date, str]] = None
+
+
+def _today_log_file_name() -> str:
+    """今日のログファイル名（pdf_merge_YYYYMMDD.log）を返す"""
+    global _today_log_cache
+    today = date.today()
+    if _today_log_cache is None or _today_log_cache[0] != today:
+        _today_log_cache = (today, f"pdf_merge_{today:%Y%m%d}.log")
+    return _today_log_cache[1]
+
 
 class SettingsTab(BaseTab):
     """設定タブ"""
 
+    # 年度入力から和暦表示を更新するまでの待ち時間（ミリ秒）
+    YEAR_UPDATE_DELAY_MS = 150
+
+    # 参照ダイアログの初期フォルダ確認を待つ最大時間（ミリ秒）
+    INITIAL_DIR_TIMEOUT_MS = 300
+
     def __init__(
         self,
         notebook: ttk.Notebook,
@@ -41,20 +162,84 @@ class SettingsTab(BaseTab):
         self.temp_var = temp_var
         self.gs_var = gs_var
         self.on_reload = on_reload
-
-        # 年度変更時に自動でyear_shortを更新
+        # 参照ダイアログのフォールバック先（起動中に変わらないため1回だけ取得）
+        self._home_dir = Path.home()
+        # ログディレクトリ（logging_configの出力先と同じ場所）
+        appdata = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+        self._log_dir = os.path.join(appdata, 'PDFMergeSystem', 'logs')
+        # 参照ダイアログ（初回使用時に作成し、タイトル・ファイル種別を設定済みのまま再利用）
+        self._dir_dialog: Optional[filedialog.Directory] = None
+        self._gs_file_dialog: Optional[filedialog.Open] = None
+        self._jtd_file_dialog: Optional[filedialog.Open] = None
+        # 確認中の参照ダイアログの初期フォルダと、確認を待つ上限のタイマー（待機中は二重に開かない）
+        self._initial_dir_future: "Optional[Future[Any]]" = None
+        self._initial_dir_timer: Optional[str] = None
+
+        # 年度変更時に自動でyear_shortを更新（入力が続く間は予約済みの1回にまとめる）
+        self._year_update_pending = False
         self.year_var.trace_add('write', self._on_year_changed)
 
+        # 行事名リストのキャッシュ: カテゴリ -> 行事名（作成元のconfigが差し替えられたら破棄）
+        self._event_names_cache: Dict[str, List[str]] = {}
+        self._event_names_config: Any = None
+
         self._create_ui()
         self.add_to_notebook("⚙️ 設定")
 
+        # 変換テストで使うモジュールを、画面の表示後にワーカーで読み込んでおく
+        self.tab.after_idle(lambda: self.run_in_background(self._preload_modules))
+
+    @staticmethod
+    def _preload_modules() -> None:
+        """
+        変換テストで使うpdf_converterを事前にインポート（ワーカースレッドで実行）
+
+        メソッド内のimportは読み込み済みモジュールの参照だけになり、
+        初回クリック時にインポートを待たずに済む。失敗した場合は使用時に改めてエラーになる。
+        """
+        try:
+            import pdf_converter  # noqa: F401 - 読み込みのみ
+        except Exception as e:
+            logger.debug(f"モジュールの事前読み込みに失敗: pdf_converter - {e}")
+
     def _on_year_changed(self, *args) -> None:
-        """年度が変更されたときに和暦を自動更新"""
+        """
+        年度が変更されたときに和暦の更新を予約
+
+        予約済みなら何もしない（キー入力ごとのafter_cancel/afterを避ける）。
+        予約した更新は実行時点の最新の値を読むため、途中の入力は自然にまとめられる。
+        """
+        if self._year_update_pending:
+            return
+        self._year_update_pending = True
+        self.tab.after(self.YEAR_UPDATE_DELAY_MS, self._apply_year_change)
+
+    def _apply_year_change(self) -> None:
+        """入力された年度から和暦を自動更新"""
+        self._year_update_pending = False
         year = self.year_var.get()
         if year.isdigit() and len(year) == 4:
             year_short = calculate_year_short(year)
             self.year_short_var.set(year_short)
 
+    @staticmethod
+    def _is_year_input_allowed(action: str, new_value: str) -> bool:
+        """
+        年度入力欄のキー入力を受け付けるか判定（validatecommand用）
+
+        削除は常に許可する（設定ファイル由来の不正な値も消して直せるようにするため）。
+
+        Args:
+            action: 操作種別（'0': 削除, '1': 挿入）
+            new_value: 変更後の入力値
+
+        Returns:
+            bool: 受け付ける場合True
+        """
+        if action == '0' or new_value == "":
+            return True
+        return new_value.isdigit() and len(new_value) <= 4
+
     def _show_file_open_error(self, error_msg: str) -> None:
         """
         ファイル/フォルダを開く際のエラーを表示（共通処理）
@@ -73,105 +258,96 @@ class SettingsTab(BaseTab):
         main_container = self.scrollable_frame
 
         # 説明フレーム（初心者向け）
-        help_frame = tk.LabelFrame(main_container, text="💡 設定について", font=("メイリオ", 10, "bold"))
+        help_frame = tk.LabelFrame(main_container, text="💡 設定について", font=_FONT_BOLD_10)
         help_frame.pack(fill="x", pady=(0, 10))
 
-        help_text = (
-            "このタブでは、アプリケーションの基本設定を行います。\n\n"
-            "📁 = フォルダを選択　│　📂 = フォルダを開く\n"
-            "📄 = ファイルを選択　│　🔍 = 自動検索\n\n"
-            "⚠️ 設定を変更したら、必ず「💾 保存」ボタンをクリックしてください。"
-        )
         tk.Label(
             help_frame,
-            text=help_text,
+            text=_HELP_TEXT,
             justify="left",
-            font=("メイリオ", 9),
+            font=_FONT_9,
             fg="#333",
             padx=15,
             pady=10
         ).pack(anchor="w")
 
-        # 共通のラベル幅とパディング
-        LABEL_WIDTH = 16
-        PAD_Y = 5
-
         # --- 年度情報 ---
-        year_frame = tk.LabelFrame(main_container, text="📅 年度情報", font=("メイリオ", 10, "bold"))
+        year_frame = tk.LabelFrame(main_container, text="📅 年度情報", font=_FONT_BOLD_10)
         year_frame.pack(fill="x", pady=(0, 8))
 
-        tk.Label(year_frame, text="年度（西暦）:", width=LABEL_WIDTH, anchor="e").grid(row=0, column=0, sticky="e", padx=(10, 3), pady=PAD_Y)
-        tk.Entry(year_frame, textvariable=self.year_var, width=15).grid(row=0, column=1, sticky="w", padx=3, pady=PAD_Y)
-        tk.Label(year_frame, text="→", font=("メイリオ", 10)).grid(row=0, column=2, sticky="w", padx=3, pady=PAD_Y)
-        tk.Label(year_frame, textvariable=self.year_short_var, font=("メイリオ", 10, "bold"), fg="#1976D2").grid(row=0, column=3, sticky="w", padx=3, pady=PAD_Y)
-        tk.Label(year_frame, text="💡 和暦は自動計算", font=("メイリオ", 8), fg="gray").grid(row=1, column=1, columnspan=3, sticky="w", padx=3, pady=(0, 5))
+        tk.Label(year_frame, text="年度（西暦）:", width=_LABEL_WIDTH, anchor="e").grid(row=0, column=0, sticky="e", padx=(10, 3), pady=_PAD_Y)
+        # 数字以外・5桁以上の入力はTk側で受け付けない（%d: 操作種別, %P: 変更後の値）
+        year_vcmd = (self.tab.register(self._is_year_input_allowed), '%d', '%P')
+        tk.Entry(
+            year_frame, textvariable=self.year_var, width=15,
+            validate='key', validatecommand=year_vcmd
+        ).grid(row=0, column=1, sticky="w", padx=3, pady=_PAD_Y)
+        tk.Label(year_frame, text="→", font=_FONT_10).grid(row=0, column=2, sticky="w", padx=3, pady=_PAD_Y)
+        tk.Label(year_frame, textvariable=self.year_short_var, font=_FONT_BOLD_10, fg="#1976D2").grid(row=0, column=3, sticky="w", padx=3, pady=_PAD_Y)
+        tk.Label(year_frame, text="💡 和暦は自動計算", font=_FONT_8, fg="gray").grid(row=1, column=1, columnspan=3, sticky="w", padx=3, pady=(0, 5))
 
         # --- パス設定 ---
-        path_frame = tk.LabelFrame(main_container, text="📂 パス設定", font=("メイリオ", 10, "bold"))
+        path_frame = tk.LabelFrame(main_container, text="📂 パス設定", font=_FONT_BOLD_10)
         path_frame.pack(fill="x", pady=8)
 
-        tk.Label(path_frame, text="Google Drive:", width=LABEL_WIDTH, anchor="e").grid(row=0, column=0, sticky="e", padx=(10, 3), pady=PAD_Y)
-        tk.Entry(path_frame, textvariable=self.gdrive_var).grid(row=0, column=1, sticky="ew", padx=3, pady=PAD_Y)
+        tk.Label(path_frame, text="Google Drive:", width=_LABEL_WIDTH, anchor="e").grid(row=0, column=0, sticky="e", padx=(10, 3), pady=_PAD_Y)
+        tk.Entry(path_frame, textvariable=self.gdrive_var).grid(row=0, column=1, sticky="ew", padx=3, pady=_PAD_Y)
 
-        gdrive_btn_frame = tk.Frame(path_frame)
-        gdrive_btn_frame.grid(row=0, column=2, padx=(3, 10), pady=PAD_Y)
-        tk.Button(gdrive_btn_frame, text="📁", command=lambda: self._browse_folder(self.gdrive_var), width=3).pack(side="left", padx=1)
-        tk.Button(gdrive_btn_frame, text="📂", command=lambda: self._open_folder(self.gdrive_var), width=3).pack(side="left", padx=1)
+        # ボタンは中間フレームを作らず、親のグリッドに直接配置
+        tk.Button(path_frame, text="📁", command=partial(self._browse_folder, self.gdrive_var), width=3).grid(row=0, column=2, padx=(3, 1), pady=_PAD_Y)
+        tk.Button(path_frame, text="📂", command=partial(self._open_folder, self.gdrive_var), width=3).grid(row=0, column=3, padx=(1, 10), pady=_PAD_Y)
 
-        tk.Label(path_frame, text="一時フォルダ:", width=LABEL_WIDTH, anchor="e").grid(row=1, column=0, sticky="e", padx=(10, 3), pady=PAD_Y)
-        tk.Entry(path_frame, textvariable=self.temp_var).grid(row=1, column=1, sticky="ew", padx=3, pady=PAD_Y)
+        tk.Label(path_frame, text="一時フォルダ:", width=_LABEL_WIDTH, anchor="e").grid(row=1, column=0, sticky="e", padx=(10, 3), pady=_PAD_Y)
+        tk.Entry(path_frame, textvariable=self.temp_var).grid(row=1, column=1, sticky="ew", padx=3, pady=_PAD_Y)
 
-        temp_btn_frame = tk.Frame(path_frame)
-        temp_btn_frame.grid(row=1, column=2, padx=(3, 10), pady=PAD_Y)
-        tk.Button(temp_btn_frame, text="📁", command=lambda: self._browse_folder(self.temp_var), width=3).pack(side="left", padx=1)
-        tk.Button(temp_btn_frame, text="📂", command=self._open_temp_folder, width=3).pack(side="left", padx=1)
+        tk.Button(path_frame, text="📁", command=partial(self._browse_folder, self.temp_var), width=3).grid(row=1, column=2, padx=(3, 1), pady=_PAD_Y)
+        tk.Button(path_frame, text="📂", command=self._open_temp_folder, width=3).grid(row=1, column=3, padx=(1, 10), pady=_PAD_Y)
 
         path_frame.columnconfigure(1, weight=1)
 
         # --- ツール設定 ---
-        tool_frame = tk.LabelFrame(main_container, text="🔧 ツール設定", font=("メイリオ", 10, "bold"))
+        tool_frame = tk.LabelFrame(main_container, text="🔧 ツール設定", font=_FONT_BOLD_10)
         tool_frame.pack(fill="x", pady=8)
 
-        tk.Label(tool_frame, text="Ghostscript:", width=LABEL_WIDTH, anchor="e").grid(row=0, column=0, sticky="e", padx=(10, 3), pady=PAD_Y)
-        tk.Entry(tool_frame, textvariable=self.gs_var).grid(row=0, column=1, sticky="ew", padx=3, pady=PAD_Y)
+        tk.Label(tool_frame, text="Ghostscript:", width=_LABEL_WIDTH, anchor="e").grid(row=0, column=0, sticky="e", padx=(10, 3), pady=_PAD_Y)
+        tk.Entry(tool_frame, textvariable=self.gs_var).grid(row=0, column=1, sticky="ew", padx=3, pady=_PAD_Y)
 
-        gs_btn_frame = tk.Frame(tool_frame)
-        gs_btn_frame.grid(row=0, column=2, padx=(3, 10), pady=PAD_Y)
-        tk.Button(gs_btn_frame, text="📄", command=self._browse_gs_file, width=3).pack(side="left", padx=1)
-        tk.Button(gs_btn_frame, text="🔍 自動検出", command=self._auto_detect_ghostscript, font=("メイリオ", 8)).pack(side="left", padx=1)
+        tk.Button(tool_frame, text="📄", command=self._browse_gs_file, width=3).grid(row=0, column=2, padx=(3, 1), pady=_PAD_Y)
+        tk.Button(tool_frame, text="🔍 自動検出", command=self._auto_detect_ghostscript, font=_FONT_8).grid(row=0, column=3, padx=(1, 10), pady=_PAD_Y)
 
         # Ghostscriptステータス表示
-        self.gs_status_label = tk.Label(tool_frame, text="", fg="gray", font=("メイリオ", 8))
-        self.gs_status_label.grid(row=1, column=1, columnspan=2, sticky="w", padx=3, pady=(0, 3))
+        self.gs_status_label = tk.Label(tool_frame, text="", fg="gray", font=_FONT_8)
+        self.gs_status_label.grid(row=1, column=1, columnspan=3, sticky="w", padx=3, pady=(0, 3))
         self._update_gs_status()
 
         tool_frame.columnconfigure(1, weight=1)
 
         # --- 一太郎設定 ---
-        ichitaro_frame = tk.LabelFrame(main_container, text="📝 一太郎変換設定", font=("メイリオ", 10, "bold"))
+        ichitaro_frame = tk.LabelFrame(main_container, text="📝 一太郎変換設定", font=_FONT_BOLD_10)
         ichitaro_frame.pack(fill="x", pady=8)
 
         # 設定値の読み込み
-        self.max_retries_var = tk.StringVar(value=str(self.config.get('ichitaro', 'max_retries') or 3))
-        self.save_wait_var = tk.StringVar(value=str(self.config.get('ichitaro', 'save_wait_seconds') or 20))
+        ichitaro_config = self.config.get('ichitaro') or {}
+        self.max_retries_var = tk.StringVar(value=str(ichitaro_config.get('max_retries') or 3))
+        self.save_wait_var = tk.StringVar(value=str(ichitaro_config.get('save_wait_seconds') or 20))
 
         # 設定行: リトライ回数、保存待機時間、テストボタン
         settings_row1 = tk.Frame(ichitaro_frame)
-        settings_row1.pack(fill="x", padx=10, pady=PAD_Y)
+        settings_row1.pack(fill="x", padx=10, pady=_PAD_Y)
         tk.Label(settings_row1, text="リトライ:").pack(side="left")
         tk.Entry(settings_row1, textvariable=self.max_retries_var, width=3).pack(side="left", padx=(3, 0))
         tk.Label(settings_row1, text="回").pack(side="left", padx=(2, 15))
         tk.Label(settings_row1, text="保存待機:").pack(side="left")
         tk.Entry(settings_row1, textvariable=self.save_wait_var, width=3).pack(side="left", padx=(3, 0))
         tk.Label(settings_row1, text="秒").pack(side="left", padx=(2, 15))
-        tk.Button(settings_row1, text="🧪 テスト", command=self._test_ichitaro_conversion, font=("メイリオ", 8)).pack(side="left", padx=5)
+        tk.Button(settings_row1, text="🧪 テスト", command=self._test_ichitaro_conversion, font=_FONT_8).pack(side="left", padx=5)
 
         # 説明ラベル
         help_label = tk.Label(
             ichitaro_frame,
             text="💡 Microsoft Print to PDFを自動選択します（環境非依存）",
             fg="#0066cc",
-            font=("メイリオ", 8)
+            font=_FONT_8
         )
         help_label.pack(anchor="w", padx=10, pady=(0, 3))
 
@@ -180,14 +356,12 @@ class SettingsTab(BaseTab):
             ichitaro_frame,
             text="処理手順: Ctrl+P → プリンター自動選択 → Enter → ファイル名 → Enter",
             fg="#666",
-            font=("メイリオ", 8)
+            font=_FONT_8
         )
         self.ichitaro_status_label.pack(anchor="w", padx=10, pady=(0, 3))
 
         # ログファイルボタン
-        log_button_frame = tk.Frame(ichitaro_frame)
-        log_button_frame.pack(anchor="w", padx=10, pady=(5, 3))
-        tk.Button(log_button_frame, text="📄 ログファイルを開く", command=self._open_log_file, font=("メイリオ", 8)).pack(side="left")
+        tk.Button(ichitaro_frame, text="📄 ログファイルを開く", command=self._open_log_file, font=_FONT_8).pack(anchor="w", padx=10, pady=(5, 3))
 
         # --- 行事名設定（折りたたみ式） ---
         event_names_container = tk.Frame(main_container)
@@ -203,7 +377,7 @@ class SettingsTab(BaseTab):
             event_header_frame,
             text="▶ 行事名設定（Excel転記用）を展開",
             command=self._toggle_event_names_section,
-            font=("メイリオ", 10, "bold"),
+            font=_FONT_BOLD_10,
             relief="flat",
             anchor="w",
             cursor="hand2",
@@ -214,29 +388,20 @@ class SettingsTab(BaseTab):
         # 折りたたみ可能なコンテンツフレーム
         self.event_names_content = tk.Frame(event_names_container)
         # デフォルトでは非表示（pack_forget状態）
-
-        # タブビュー作成
-        self.event_tabs = ttk.Notebook(self.event_names_content)
-        self.event_tabs.pack(fill="both", expand=True, padx=10, pady=5)
-
-        # 各カテゴリのタブを作成
-        self.event_listboxes = {}
+        # タブとリストボックスは初めて展開したときに作成する（_build_event_tabs）
+        self.event_tabs: Optional[ttk.Notebook] = None
+        self.event_listboxes: Dict[str, tk.Listbox] = {}
         self.event_categories = {
             "school_events": "学校行事名 (D列)",
             "student_council_events": "児童会行事名 (C列)",
             "other_activities": "その他の活動 (C列)"
         }
 
-        for category, tab_name in self.event_categories.items():
-            tab_frame = tk.Frame(self.event_tabs)
-            self.event_tabs.add(tab_frame, text=tab_name)
-            self._create_event_listbox_panel(tab_frame, category)
-
         # 説明ラベル（折りたたみ時も表示）
         tk.Label(
             event_names_container,
             text="💡 Excelタブから行事名を読み込めます。カスタマイズする場合は上記を展開してください。",
-            font=("メイリオ", 8),
+            font=_FONT_8,
             fg="#666"
         ).pack(anchor="w", padx=15, pady=(3, 0))
 
@@ -249,7 +414,7 @@ class SettingsTab(BaseTab):
             text="💾 保存 (Ctrl+S)",
             command=self.save_settings,
             color="primary",
-            font=("メイリオ", 9, "bold"),
+            font=_FONT_BOLD_9,
             width=14,
             height=1
         )
@@ -259,7 +424,7 @@ class SettingsTab(BaseTab):
             button_frame,
             text="🔄 再読み込み (Ctrl+R)",
             command=self.reload_settings,
-            font=("メイリオ", 9),
+            font=_FONT_9,
             width=18,
             height=1,
             cursor="hand2"
@@ -270,7 +435,7 @@ class SettingsTab(BaseTab):
             button_frame,
             text="📝 config.json編集",
             command=self.open_config_file,
-            font=("メイリオ", 9),
+            font=_FONT_9,
             width=16,
             height=1,
             cursor="hand2"
@@ -286,10 +451,25 @@ class SettingsTab(BaseTab):
             self.event_names_expanded.set(False)
         else:
             # 展開
+            if self.event_tabs is None:
+                self._build_event_tabs()
             self.event_names_content.pack(fill="both", expand=True, padx=5, pady=5)
             self.event_toggle_button.config(text="▼ 行事名設定（Excel転記用）を折りたたむ")
             self.event_names_expanded.set(True)
 
+    def _build_event_tabs(self) -> None:
+        """行事名のカテゴリ別タブとリストボックスを作成（初回展開時のみ）"""
+        self.event_tabs = ttk.Notebook(self.event_names_content)
+        self.event_tabs.pack(fill="both", expand=True, padx=10, pady=5)
+
+        for category, tab_name in self.event_categories.items():
+            tab_frame = tk.Frame(self.event_tabs)
+            self.event_tabs.add(tab_frame, text=tab_name)
+            self._create_event_listbox_panel(tab_frame, category)
+
+        # 後から作成したウィジェットにもスクロール用のマウスホイール処理を適用
+        self.bind_mousewheel(self.event_tabs)
+
     def _create_event_listbox_panel(self, parent: tk.Frame, category: str) -> None:
         """リストボックスパネルを作成"""
         # メインコンテナ（左右分割）
@@ -307,9 +487,12 @@ class SettingsTab(BaseTab):
         listbox = tk.Listbox(
             list_frame,
             yscrollcommand=scrollbar.set,
-            font=("メイリオ", 9),
+            font=_FONT_9,
             height=12,
-            selectmode="single"
+            selectmode="single",
+            # 選択状態をリストボックスごとに保持（他のリストや入力欄の選択で解除されない）
+            exportselection=False,
+            activestyle="none"
         )
         listbox.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=listbox.yview)
@@ -328,8 +511,8 @@ class SettingsTab(BaseTab):
         tk.Button(
             button_panel,
             text="➕ 追加",
-            command=lambda: self._on_add_event_name(category),
-            font=("メイリオ", 9),
+            command=partial(self._on_add_event_name, category),
+            font=_FONT_9,
             width=12,
             cursor="hand2"
         ).pack(pady=3)
@@ -337,8 +520,8 @@ class SettingsTab(BaseTab):
         tk.Button(
             button_panel,
             text="✏️ 編集",
-            command=lambda: self._on_edit_event_name(category),
-            font=("メイリオ", 9),
+            command=partial(self._on_edit_event_name, category),
+            font=_FONT_9,
             width=12,
             cursor="hand2"
         ).pack(pady=3)
@@ -346,8 +529,8 @@ class SettingsTab(BaseTab):
         tk.Button(
             button_panel,
             text="🗑️ 削除",
-            command=lambda: self._on_delete_event_name(category),
-            font=("メイリオ", 9),
+            command=partial(self._on_delete_event_name, category),
+            font=_FONT_9,
             width=12,
             cursor="hand2"
         ).pack(pady=3)
@@ -357,8 +540,8 @@ class SettingsTab(BaseTab):
         tk.Button(
             button_panel,
             text="⬆️ 上へ",
-            command=lambda: self._on_move_up(category),
-            font=("メイリオ", 9),
+            command=partial(self._on_move_up, category),
+            font=_FONT_9,
             width=12,
             cursor="hand2"
         ).pack(pady=3)
@@ -366,8 +549,8 @@ class SettingsTab(BaseTab):
         tk.Button(
             button_panel,
             text="⬇️ 下へ",
-            command=lambda: self._on_move_down(category),
-            font=("メイリオ", 9),
+            command=partial(self._on_move_down, category),
+            font=_FONT_9,
             width=12,
             cursor="hand2"
         ).pack(pady=3)
@@ -377,8 +560,8 @@ class SettingsTab(BaseTab):
         tk.Button(
             button_panel,
             text="🔄 デフォルトに戻す",
-            command=lambda: self._on_reset_to_default(category),
-            font=("メイリオ", 8),
+            command=partial(self._on_reset_to_default, category),
+            font=_FONT_8,
             width=12,
             cursor="hand2",
             fg="blue"
@@ -389,21 +572,64 @@ class SettingsTab(BaseTab):
         listbox = self.event_listboxes[category]
         listbox.delete(0, tk.END)
 
-        event_names = self.config.get_event_names(category)
-        for name in event_names:
-            listbox.insert(tk.END, name)
+        # 1回のinsertでまとめて追加（項目ごとのTcl呼び出しを避ける）
+        event_names = self._get_event_names(category)
+        if event_names:
+            listbox.insert(tk.END, *event_names)
+
+    def _get_event_names(self, category: str) -> List[str]:
+        """
+        行事名リストを取得（キャッシュ済みならそれを返す）
+
+        返すリストはタブ専用のコピーで、編集操作はこのリストを直接変更してから
+        _save_event_namesで保存する。
+
+        Args:
+            category: 行事名のカテゴリ
+
+        Returns:
+            List[str]: 行事名のリスト
+        """
+        if self._event_names_config is not self.config:
+            # 設定の再読み込みでconfigが差し替えられた
+            self._event_names_cache.clear()
+            self._event_names_config = self.config
+        event_names = self._event_names_cache.get(category)
+        if event_names is None:
+            event_names = list(self.config.get_event_names(category))
+            self._event_names_cache[category] = event_names
+        return event_names
+
+    def _save_event_names(self, category: str) -> None:
+        """
+        キャッシュ中の行事名リストを設定に保存
+
+        保存に失敗した場合はキャッシュを破棄し、次回は設定から読み直す。
+
+        Args:
+            category: 行事名のカテゴリ
+
+        Raises:
+            ConfigurationError: 保存に失敗した場合
+        """
+        try:
+            # 設定側とリストを共有しないようコピーを渡す
+            self.config.save_event_names(category, list(self._get_event_names(category)))
+        except Exception:
+            self._event_names_cache.pop(category, None)
+            raise
 
     def reload_event_names(self) -> None:
         """すべてのカテゴリの行事名をリロード（外部から呼び出し可能）"""
         logger.info("設定タブの行事名をリロードしています...")
-        for category in self.event_categories.keys():
+        self._event_names_cache.clear()
+        # リストボックス未作成（未展開）の場合は、展開時に最新の値が読み込まれる
+        for category in self.event_listboxes:
             self._load_event_names_to_listbox(category)
         logger.info("設定タブの行事名をリロードしました")
 
     def _on_add_event_name(self, category: str) -> None:
         """行事名を追加"""
-        from tkinter import simpledialog
-
         new_name = simpledialog.askstring(
             "行事名を追加",
             "新しい行事名を入力してください:",
@@ -412,12 +638,12 @@ class SettingsTab(BaseTab):
 
         if new_name and new_name.strip():
             new_name = new_name.strip()
-            event_names = self.config.get_event_names(category)
+            event_names = self._get_event_names(category)
             event_names.append(new_name)
 
             try:
-                self.config.save_event_names(category, event_names)
-                self._load_event_names_to_listbox(category)
+                self._save_event_names(category)
+                self.event_listboxes[category].insert(tk.END, new_name)
                 self.update_status(f"行事名を追加: {new_name}")
             except Exception as e:
                 logger.error(f"行事名追加エラー: {e}", exc_info=True)
@@ -425,8 +651,6 @@ class SettingsTab(BaseTab):
 
     def _on_edit_event_name(self, category: str) -> None:
         """行事名を編集"""
-        from tkinter import simpledialog
-
         listbox = self.event_listboxes[category]
         selection = listbox.curselection()
 
@@ -435,7 +659,7 @@ class SettingsTab(BaseTab):
             return
 
         index = selection[0]
-        event_names = self.config.get_event_names(category)
+        event_names = self._get_event_names(category)
         old_name = event_names[index]
 
         new_name = simpledialog.askstring(
@@ -450,8 +674,10 @@ class SettingsTab(BaseTab):
             event_names[index] = new_name
 
             try:
-                self.config.save_event_names(category, event_names)
-                self._load_event_names_to_listbox(category)
+                self._save_event_names(category)
+                # 編集した行だけを置き換える
+                listbox.delete(index)
+                listbox.insert(index, new_name)
                 listbox.selection_set(index)  # 編集後も同じ位置を選択
                 self.update_status(f"行事名を編集: {old_name} → {new_name}")
             except Exception as e:
@@ -468,7 +694,7 @@ class SettingsTab(BaseTab):
             return
 
         index = selection[0]
-        event_names = self.config.get_event_names(category)
+        event_names = self._get_event_names(category)
         name = event_names[index]
 
         # 確認ダイアログ
@@ -482,8 +708,8 @@ class SettingsTab(BaseTab):
             event_names.pop(index)
 
             try:
-                self.config.save_event_names(category, event_names)
-                self._load_event_names_to_listbox(category)
+                self._save_event_names(category)
+                listbox.delete(index)
                 self.update_status(f"行事名を削除: {name}")
             except Exception as e:
                 logger.error(f"行事名削除エラー: {e}", exc_info=True)
@@ -501,15 +727,18 @@ class SettingsTab(BaseTab):
         index = selection[0]
 
         if index == 0:
-            messagebox.showinfo("移動不可", "既に最上位です。")
+            self.update_status("既に最上位です")
             return
 
-        event_names = self.config.get_event_names(category)
+        event_names = self._get_event_names(category)
         event_names[index], event_names[index - 1] = event_names[index - 1], event_names[index]
 
         try:
-            self.config.save_event_names(category, event_names)
-            self._load_event_names_to_listbox(category)
+            self._save_event_names(category)
+            # 入れ替わった2行だけを更新
+            listbox.delete(index)
+            listbox.insert(index - 1, event_names[index - 1])
+            listbox.selection_clear(0, tk.END)
             listbox.selection_set(index - 1)  # 移動後の位置を選択
             self.update_status(f"行事名を上へ移動: {event_names[index - 1]}")
         except Exception as e:
@@ -526,17 +755,20 @@ class SettingsTab(BaseTab):
             return
 
         index = selection[0]
-        event_names = self.config.get_event_names(category)
+        event_names = self._get_event_names(category)
 
         if index == len(event_names) - 1:
-            messagebox.showinfo("移動不可", "既に最下位です。")
+            self.update_status("既に最下位です")
             return
 
         event_names[index], event_names[index + 1] = event_names[index + 1], event_names[index]
 
         try:
-            self.config.save_event_names(category, event_names)
-            self._load_event_names_to_listbox(category)
+            self._save_event_names(category)
+            # 入れ替わった2行だけを更新
+            listbox.delete(index)
+            listbox.insert(index + 1, event_names[index + 1])
+            listbox.selection_clear(0, tk.END)
             listbox.selection_set(index + 1)  # 移動後の位置を選択
             self.update_status(f"行事名を下へ移動: {event_names[index + 1]}")
         except Exception as e:
@@ -557,73 +789,149 @@ class SettingsTab(BaseTab):
 
         try:
             was_reset = self.config.reset_event_names(category)
+            self._event_names_cache.pop(category, None)
             if was_reset:
                 self._load_event_names_to_listbox(category)
                 self.update_status("行事名をデフォルトに戻しました")
                 messagebox.showinfo("完了", "行事名をデフォルト値に戻しました。")
             else:
-                messagebox.showinfo("完了", "既にデフォルト値です。")
+                self.update_status("行事名は既にデフォルト値です")
         except Exception as e:
             logger.error(f"デフォルト復元エラー: {e}", exc_info=True)
             messagebox.showerror("エラー", f"デフォルト値への復元に失敗しました。\n\n詳細: {e}")
 
     def _browse_folder(self, var: tk.StringVar) -> None:
-        """フォルダを参照（PathValidatorベース）"""
+        """
+        フォルダを参照（PathValidatorベース）
+
+        Google Drive等の応答が遅いパスの確認でUIが固まらないよう、初期フォルダはワーカーで確認し、
+        確認が終わった時点でダイアログを開く。INITIAL_DIR_TIMEOUT_MS 以内に終わらなければ
+        ホームディレクトリで開く（確認自体は続き、結果はPathValidatorのキャッシュに残る）。
+        """
+        if self._initial_dir_future is not None:
+            return
+
+        future = self.run_in_background(
+            partial(PathValidator.get_safe_initial_dir, var.get().strip(), self._home_dir)
+        )
+        self._initial_dir_future = future
+        self._initial_dir_timer = self.tab.after(
+            self.INITIAL_DIR_TIMEOUT_MS, partial(self._show_folder_dialog, var, future, False)
+        )
+        future.add_done_callback(
+            lambda f: thread_safe_call(self.tab, partial(self._show_folder_dialog, var, f, True))
+        )
+
+    def _show_folder_dialog(self, var: tk.StringVar, future: "Future[Any]", resolved: bool) -> None:
+        """
+        フォルダ選択ダイアログを開く（メインスレッドで実行）
+
+        Args:
+            var: 選択結果を設定する変数
+            future: 初期フォルダの確認
+            resolved: 確認の完了による呼び出しか（Falseは待機の上限による呼び出し）
+        """
+        # 確認の完了と待機の上限のうち、先に来た方だけが開く
+        if future is not self._initial_dir_future:
+            return
+        self._initial_dir_future = None
+        if resolved and self._initial_dir_timer is not None:
+            self.tab.after_cancel(self._initial_dir_timer)
+        self._initial_dir_timer = None
+
+        initial_dir = self._home_dir
+        if resolved and not future.cancelled() and future.exception() is None:
+            initial_dir = future.result()
+
         try:
-            current_path_str = var.get().strip()
-            initial_dir = PathValidator.get_safe_initial_dir(current_path_str, Path.home())
+            if self._dir_dialog is None:
+                self._dir_dialog = filedialog.Directory(self.tab, title="フォルダを選択")
+            directory = self._dir_dialog.show(initialdir=str(initial_dir))
+            if not directory:
+                return
 
-            directory = filedialog.askdirectory(title="フォルダを選択", initialdir=str(initial_dir))
-            if directory:
-                is_valid, error_msg, validated_path = PathValidator.validate_directory(
-                    directory, must_exist=True
-                )
-                if is_valid and validated_path:
-                    var.set(str(validated_path))
-                    self.update_status(f"フォルダを選択: {validated_path.name}")
-                else:
-                    messagebox.showerror("パスエラー", error_msg or "フォルダが無効です")
+            def on_valid(validated_path: Path) -> None:
+                var.set(str(validated_path))
+                self.update_status(f"フォルダを選択: {validated_path.name}")
+
+            self._validate_in_background(
+                partial(PathValidator.validate_directory, directory, must_exist=True),
+                on_valid, "パスエラー", "フォルダが無効です"
+            )
         except Exception as e:
             messagebox.showerror("参照エラー", f"フォルダの参照中にエラーが発生しました。\n\n詳細: {e}")
 
+    def _validate_in_background(
+        self,
+        validate: Callable[[], Tuple[bool, Optional[str], Optional[Path]]],
+        on_valid: Callable[[Path], None],
+        error_title: str,
+        default_error: str
+    ) -> None:
+        """
+        参照ダイアログで選択したパスをワーカーで検証し、結果をUIに反映
+
+        ネットワーク上のパスの検証でUIが固まらないよう、検証はタブのワーカーで行う。
+
+        Args:
+            validate: PathValidatorによる検証（(is_valid, error_msg, validated_path) を返す）
+            on_valid: 検証に成功した場合にメインスレッドで呼ぶ関数
+            error_title: 検証に失敗した場合のエラーダイアログのタイトル
+            default_error: 検証結果にエラーメッセージがない場合の表示
+        """
+        def task() -> None:
+            is_valid, error_msg, validated_path = validate()
+
+            def update_ui() -> None:
+                if is_valid and validated_path:
+                    on_valid(validated_path)
+                else:
+                    messagebox.showerror(error_title, error_msg or default_error)
+
+            thread_safe_call(self.tab, update_ui)
+
+        self.run_in_background(task)
+
     def _browse_gs_file(self) -> None:
         """Ghostscript実行ファイルを参照（フリーズ防止版）"""
         try:
             current_path = self.gs_var.get().strip()
             # ローカルパス（C:ドライブ）のみチェック（フリーズ防止）
             if current_path:
-                # ネットワークパスかチェック
-                if not current_path.startswith('\\\\') and len(current_path) >= 3 and current_path[1] == ':':
-                    drive = current_path[0].upper()
-                    if drive in ['C', 'D', 'E'] and os.path.exists(current_path) and os.path.isfile(current_path):
-                        initial_dir = os.path.dirname(current_path)
-                    else:
-                        initial_dir = "C:\\Program Files"
+                # ネットワークパス（UNC）はドライブ部が\\server\share形式になるため対象外
+                drive, _ = os.path.splitdrive(current_path)
+                if drive.upper() in _LOCAL_DRIVES and os.path.isfile(current_path):
+                    initial_dir = os.path.dirname(current_path)
                 else:
                     initial_dir = "C:\\Program Files"
-            elif os.path.exists("C:\\Program Files\\gs"):
+            elif _cached_exists("C:\\Program Files\\gs"):
                 initial_dir = "C:\\Program Files\\gs"
             else:
                 initial_dir = "C:\\Program Files"
 
-            file_path = filedialog.askopenfilename(
-                title="Ghostscript実行ファイルを選択",
-                initialdir=initial_dir,
-                filetypes=[("実行ファイル", "*.exe"), ("すべて", "*.*")]
-            )
-            if file_path:
-                # PathValidatorで検証
-                is_valid, error_msg, validated_path = PathValidator.validate_file_path(
-                    file_path,
-                    must_exist=True
+            if self._gs_file_dialog is None:
+                self._gs_file_dialog = filedialog.Open(
+                    self.tab,
+                    title="Ghostscript実行ファイルを選択",
+                    filetypes=[("実行ファイル", "*.exe"), ("すべて", "*.*")]
                 )
-                if not is_valid:
-                    messagebox.showerror("パス検証エラー", error_msg)
-                    return
+            # 前回選択したファイル名は引き継がない
+            file_path = self._gs_file_dialog.show(initialdir=initial_dir, initialfile="")
+            if not file_path:
+                return
 
+            def validate() -> Tuple[bool, Optional[str], Optional[Path]]:
+                result = PathValidator.validate_file_path(file_path, must_exist=True)
+                if result[0]:
+                    _set_exists_cache(str(result[2]), True)
+                return result
+
+            def on_valid(validated_path: Path) -> None:
                 self.gs_var.set(str(validated_path))
-                self._update_gs_status_sync()
+                self._update_gs_status_async()
                 self.update_status(f"Ghostscript: {validated_path.name}")
+
+            self._validate_in_background(validate, on_valid, "パス検証エラー", "ファイルが無効です")
         except Exception as e:
             messagebox.showerror("参照エラー", f"ファイルの参照中にエラーが発生しました。\n\n詳細: {e}")
 
@@ -636,7 +944,7 @@ class SettingsTab(BaseTab):
             return
 
         if open_file_or_folder(folder_path_str, self._show_file_open_error):
-            self.update_status(f"フォルダを開きました: {Path(folder_path_str).name}")
+            self.update_status(f"フォルダを開きました: {os.path.basename(os.path.normpath(folder_path_str))}")
 
     def _open_temp_folder(self) -> None:
         """一時フォルダをエクスプローラーで開く（フリーズ防止版）"""
@@ -647,56 +955,55 @@ class SettingsTab(BaseTab):
             appdata = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
             temp_path_str = os.path.join(appdata, 'PDFMergeSystem', 'temp')
 
-        temp_path = Path(temp_path_str)
+        temp_path_str = os.path.normpath(temp_path_str)
 
-        # フォルダが存在しない場合は作成（os.path経由でフリーズ防止）
-        temp_path_str_final = str(temp_path)
-        if not os.path.exists(temp_path_str_final):
-            try:
-                temp_path.mkdir(parents=True, exist_ok=True)
-                self.update_status(f"一時フォルダを作成しました: {temp_path.name}")
-            except Exception as e:
-                messagebox.showerror("エラー", f"一時フォルダの作成に失敗しました。\n\n{e}")
-                return
+        # フォルダが存在しない場合は作成（事前の存在確認はせず、mkdirの結果で判定）
+        try:
+            os.makedirs(temp_path_str)
+            self.update_status(f"一時フォルダを作成しました: {os.path.basename(temp_path_str)}")
+        except FileExistsError:
+            pass
+        except Exception as e:
+            messagebox.showerror("エラー", f"一時フォルダの作成に失敗しました。\n\n{e}")
+            return
 
         # エクスプローラーで開く（非同期）
-        if open_file_or_folder(str(temp_path), self._show_file_open_error):
+        if open_file_or_folder(temp_path_str, self._show_file_open_error):
             self.update_status("一時フォルダを開きました")
 
     def save_settings(self) -> None:
         """設定を保存（入力検証付き - ベストプラクティス準拠）"""
+        # 入力値は最初にまとめて読み取り、以降はこの値だけを使う
         year = self.year_var.get().strip()
+        gdrive_path = self.gdrive_var.get()
+        temp_path = self.temp_var.get()
+        gs_path = self.gs_var.get()
+        retries_raw = self.max_retries_var.get()
+        wait_raw = self.save_wait_var.get()
 
         if not year:
             messagebox.showerror("入力エラー", "年度情報は必須です。")
             return
 
-        # year_shortは自動計算（update_yearに渡さない）
-        self.config.update_year(year)
-        self.config.set('base_paths', 'google_drive', value=self.gdrive_var.get())
-        self.config.set('base_paths', 'local_temp', value=self.temp_var.get())
-        self.config.set('ghostscript', 'executable', value=self.gs_var.get())
-
-        # 一太郎設定の保存（入力検証付き）
+        # 一太郎設定の入力検証（すべて検証してから設定を変更する）
         validation_errors = []
+        ichitaro_values: Dict[str, int] = {}
 
-        try:
-            retry_value = int(self.max_retries_var.get())
-            if retry_value < 0 or retry_value > 10:
-                validation_errors.append("• リトライ回数は0～10の範囲で入力してください")
-            else:
-                self.config.set('ichitaro', 'max_retries', value=retry_value)
-        except ValueError:
-            validation_errors.append("• リトライ回数は整数で入力してください")
-
-        try:
-            wait_value = int(self.save_wait_var.get())
-            if wait_value < 5 or wait_value > 120:
-                validation_errors.append("• 保存待機時間は5～120秒の範囲で入力してください")
+        # (入力値, 設定キー, 最小値, 最大値, 項目名, 範囲の表示)
+        int_fields = (
+            (retries_raw, 'max_retries', 0, 10, "リトライ回数", "0～10"),
+            (wait_raw, 'save_wait_seconds', 5, 120, "保存待機時間", "5～120秒"),
+        )
+        for raw, key, low, high, label, range_text in int_fields:
+            try:
+                value = int(raw)
+            except ValueError:
+                validation_errors.append(f"• {label}は整数で入力してください")
+                continue
+            if low <= value <= high:
+                ichitaro_values[key] = value
             else:
-                self.config.set('ichitaro', 'save_wait_seconds', value=wait_value)
-        except ValueError:
-            validation_errors.append("• 保存待機時間は整数で入力してください")
+                validation_errors.append(f"• {label}は{range_text}の範囲で入力してください")
 
         # 検証エラーがあれば表示して保存を中断
         if validation_errors:
@@ -705,7 +1012,16 @@ class SettingsTab(BaseTab):
             return
 
         try:
-            self.config.save_config()
+            # 変更をまとめて1回で保存
+            with self.config.bulk_update():
+                # year_shortは自動計算（update_yearに渡さない）
+                self.config.update_year(year)
+                self.config.set('base_paths', 'google_drive', value=gdrive_path)
+                self.config.set('base_paths', 'local_temp', value=temp_path)
+                self.config.set('ghostscript', 'executable', value=gs_path)
+                for key, value in ichitaro_values.items():
+                    self.config.set('ichitaro', key, value=value)
+            PathValidator.invalidate_safe_dir_cache()
             self.update_status("設定を保存しました")
             messagebox.showinfo("保存完了", "設定を保存しました！")
         except Exception as e:
@@ -714,8 +1030,9 @@ class SettingsTab(BaseTab):
 
     def reload_settings(self) -> None:
         """設定を再読み込み"""
+        PathValidator.invalidate_safe_dir_cache()
         self.on_reload()
-        self._update_gs_status_sync()
+        self._update_gs_status_async()
 
     def open_config_file(self) -> None:
         """config.jsonをテキストエディタで開く"""
@@ -730,19 +1047,25 @@ class SettingsTab(BaseTab):
         self.gs_status_label.config(text="🔍 検索中...", fg="blue")
 
         def detect_task() -> None:
-            from ghostscript_utils import GhostscriptManager
-
+            # 明示的な再検出なので、以前の動作確認結果は使わない
+            _gs_verify_cache.clear()
             gs_path = GhostscriptManager.find_ghostscript()
-            verified = gs_path and GhostscriptManager.verify_ghostscript(gs_path)
+            verified = gs_path and _verify_ghostscript_cached(gs_path)
+
+            # 存在確認はここ（ワーカースレッド）で済ませ、UI側の確認はキャッシュから返す
+            if gs_path:
+                _set_exists_cache(gs_path, os.path.exists(gs_path))
 
             def update_ui() -> None:
                 if verified:
                     self.gs_var.set(gs_path)
-                    self._update_gs_status_sync()
+                    # 動作確認は検出時に済んでいるため、結果をそのまま表示する
+                    text, color = self._check_gs_path(gs_path, True)
+                    self.gs_status_label.config(text=text, fg=color)
                     self.update_status(f"Ghostscriptを検出: {gs_path}")
                     messagebox.showinfo("検出成功", f"Ghostscriptを検出しました。\n\n{gs_path}")
                 else:
-                    self._update_gs_status_sync()
+                    self._update_gs_status_async()
                     instructions = GhostscriptManager.get_install_instructions()
                     messagebox.showwarning("未検出", instructions)
 
@@ -769,7 +1092,7 @@ class SettingsTab(BaseTab):
             return ("⚠️ 未設定（PDF圧縮機能は使用できません）", "orange")
         if gs_path.startswith('\\\\'):
             return ("⚠️ ネットワークパスは推奨されません", "orange")
-        if not os.path.exists(gs_path):
+        if not _cached_exists(gs_path):
             return ("❌ ファイルが存在しません", "red")
         if verified is None:
             return ("⏳ 動作確認中...", "gray")
@@ -785,87 +1108,112 @@ class SettingsTab(BaseTab):
 
         # パスが存在する場合は動作確認をバックグラウンドで実行
         if text == "⏳ 動作確認中...":
-            self.tab.after(500, self._verify_gs_async)
+            self.tab.after(500, self._verify_gs_async, gs_path)
+
+    def _update_gs_status_async(self) -> None:
+        """
+        Ghostscriptのステータスを更新（ユーザー操作・再読み込み後の即時反映用）
+
+        gs.exeの起動を伴う動作確認はワーカースレッドで行い、
+        その間は「動作確認中」を表示してUIを止めない。
+        """
+        gs_path = self.gs_var.get().strip()
+        text, color = self._check_gs_path(gs_path)
+        self.gs_status_label.config(text=text, fg=color)
+
+        if text == "⏳ 動作確認中...":
+            self._verify_gs_async(gs_path)
+
+    def _verify_gs_async(self, gs_path: str) -> None:
+        """
+        Ghostscriptの動作確認をバックグラウンドで実行
+
+        Args:
+            gs_path: 呼び出し元がメインスレッドで読み取ったGhostscriptのパス
+                     （ステータス表示の判定と同じ値で確認する）
+        """
+        # 確認済みの実行ファイルならワーカーに投入せず、その場で結果を表示する
+        cached = _cached_gs_verification(gs_path)
+        if cached is not None:
+            text, color = self._check_gs_path(gs_path, cached)
+            self.gs_status_label.config(text=text, fg=color)
+            return
 
-    def _verify_gs_async(self) -> None:
-        """Ghostscriptの動作確認をバックグラウンドで実行"""
         def verify_task() -> None:
-            from ghostscript_utils import GhostscriptManager
-            gs_path = self.gs_var.get().strip()
-            verified = gs_path and GhostscriptManager.verify_ghostscript(gs_path)
+            verified = bool(gs_path) and _verify_ghostscript_cached(gs_path)
             text, color = self._check_gs_path(gs_path, verified)
 
-            thread_safe_call(self.tab, lambda: self.gs_status_label.config(text=text, fg=color))
+            def apply() -> None:
+                # 確認中にパスが変更された場合は古い結果を表示しない
+                if self.gs_var.get().strip() == gs_path:
+                    self.gs_status_label.config(text=text, fg=color)
 
-        thread = threading.Thread(target=verify_task, daemon=True)
-        thread.start()
+            thread_safe_call(self.tab, apply)
 
-    def _update_gs_status_sync(self) -> None:
-        """Ghostscriptのステータスを同期的に更新（ユーザー操作後の即時反映用）"""
-        from ghostscript_utils import GhostscriptManager
-        gs_path = self.gs_var.get().strip()
-        verified = GhostscriptManager.verify_ghostscript(gs_path) if os.path.exists(gs_path) and gs_path else None
-        text, color = self._check_gs_path(gs_path, verified)
-        self.gs_status_label.config(text=text, fg=color)
+        self.run_in_background(verify_task)
 
     def _test_ichitaro_conversion(self) -> None:
         """一太郎変換をテスト"""
 
         # jtdファイルを選択
-        file_path = filedialog.askopenfilename(
-            title="テスト用の一太郎ファイルを選択",
-            filetypes=[("一太郎ファイル", "*.jtd"), ("すべて", "*.*")]
-        )
+        # 2回目以降は前回選択したフォルダから開く
+        if self._jtd_file_dialog is None:
+            self._jtd_file_dialog = filedialog.Open(
+                self.tab,
+                title="テスト用の一太郎ファイルを選択",
+                filetypes=[("一太郎ファイル", "*.jtd"), ("すべて", "*.*")]
+            )
+        file_path = self._jtd_file_dialog.show(initialfile="")
         if not file_path:
             return
 
+        # 変換はワーカースレッドで行うため、表示はこのメソッドを抜けた後のアイドル時に反映される
         self.ichitaro_status_label.config(text="🔄 テスト実行中...", fg="blue")
-        self.tab.update()
+
+        def finish_test(text: str, fg: str, show_result: Callable[[], Any]) -> None:
+            """ステータス表示と結果ダイアログを1回のポストでまとめて行う（ワーカーから呼ぶ）"""
+            def _finish() -> None:
+                self.ichitaro_status_label.config(text=text, fg=fg)
+                show_result()
+
+            thread_safe_call(self.tab, _finish)
+
+        # 現在の設定に入力中の値を重ねて使用（Tkの変数はメインスレッドで読み取る）
+        # 保存前の値で設定そのものを書き換えないよう、コピーに反映する
+        ichitaro_settings = dict(self.config.get('ichitaro') or {})
+        for key, var in (('max_retries', self.max_retries_var), ('save_wait_seconds', self.save_wait_var)):
+            try:
+                ichitaro_settings[key] = int(var.get())
+            except ValueError:
+                pass
 
         def run_test():
             try:
                 from pdf_converter import PDFConverter
                 import tempfile
-
-                # 現在の設定を使用
-                ichitaro_settings = self.config.get('ichitaro') or {}
-                try:
-                    ichitaro_settings['max_retries'] = int(self.max_retries_var.get())
-                except ValueError:
-                    pass
-                try:
-                    ichitaro_settings['save_wait_seconds'] = int(self.save_wait_var.get())
-                except ValueError:
-                    pass
-
-                # セキュアな一時ファイル作成（TOCTOU攻撃対策）
                 import uuid
 
                 temp_dir = tempfile.gettempdir()
                 converter = PDFConverter(temp_dir, ichitaro_settings)
 
                 # UUID使用で衝突回避 + 安全なパス構築
+                # （変換処理は既存の出力ファイルを削除してから保存するため、
+                #   プレースホルダファイルは作成しない）
                 unique_id = uuid.uuid4().hex
                 output_path = os.path.join(temp_dir, f"ichitaro_test_{unique_id}.pdf")
 
                 try:
-                    # 一時ファイルをプレースホルダとして作成（排他的作成）
-                    fd = os.open(output_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
-                    os.close(fd)  # ファイルディスクリプタを閉じて変換処理に渡す
-
-                    result = converter._convert_ichitaro(file_path, output_path)
+                    result = converter.ichitaro_converter.convert(file_path, output_path)
 
                     if result and os.path.exists(result):
-                        thread_safe_call(self.tab, lambda: self.ichitaro_status_label.config(
-                            text="✅ 変換成功！", fg="green"))
-                        thread_safe_call(self.tab, lambda: messagebox.showinfo(
+                        finish_test("✅ 変換成功！", "green", partial(
+                            messagebox.showinfo,
                             "テスト成功",
                             f"一太郎変換が成功しました。\n\n出力ファイル:\n{result}"
                         ))
                     else:
-                        thread_safe_call(self.tab, lambda: self.ichitaro_status_label.config(
-                            text="❌ 変換失敗", fg="red"))
-                        thread_safe_call(self.tab, lambda: messagebox.showwarning(
+                        finish_test("❌ 変換失敗", "red", partial(
+                            messagebox.showwarning,
                             "テスト失敗",
                             "一太郎変換に失敗しました。\n\n"
                             "リトライ回数の設定を調整してください。"
@@ -882,9 +1230,8 @@ class SettingsTab(BaseTab):
             except Exception as test_error:
                 error_msg = str(test_error)
                 error_preview = error_msg[:50]
-                thread_safe_call(self.tab, lambda: self.ichitaro_status_label.config(
-                    text=f"❌ エラー: {error_preview}", fg="red"))
-                thread_safe_call(self.tab, lambda: messagebox.showerror(
+                finish_test(f"❌ エラー: {error_preview}", "red", partial(
+                    messagebox.showerror,
                     "テストエラー", f"テスト中にエラーが発生しました。\n\n{error_msg}"
                 ))
 
@@ -892,27 +1239,37 @@ class SettingsTab(BaseTab):
         thread.start()
 
     def _open_log_file(self) -> None:
-        """ログファイルを開く"""
-        from datetime import datetime
+        """ログファイルを開く（存在確認はワーカースレッドで行い、UIを止めない）"""
+        log_dir = self._log_dir
+        log_name = _today_log_file_name()
 
-        # ログディレクトリのパス
-        appdata = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
-        log_dir = os.path.join(appdata, 'PDFMergeSystem', 'logs')
+        def probe_task() -> None:
+            # 今日のログファイルとログディレクトリの有無を1回のディレクトリ読み取りで確認
+            # （DirEntryは種別を保持しているため、ファイルごとのstatは不要）
+            try:
+                with os.scandir(log_dir) as entries:
+                    log_entry = next((e for e in entries if e.name == log_name), None)
+                dir_exists = True
+            except OSError:
+                log_entry = None
+                dir_exists = False
+            log_file = log_entry.path if log_entry is not None and log_entry.is_file() else None
+
+            def update_ui() -> None:
+                if log_file is not None:
+                    # ログファイルをデフォルトのテキストエディタで開く
+                    if open_file_or_folder(log_file, self._show_file_open_error):
+                        self.update_status("ログファイルを開きました")
+                elif dir_exists:
+                    # ログファイルが存在しない場合はログディレクトリを開く
+                    if open_file_or_folder(log_dir, self._show_file_open_error):
+                        self.update_status("ログディレクトリを開きました")
+                else:
+                    messagebox.showwarning(
+                        "ログファイルなし",
+                        "ログファイルが見つかりません。\n\nまだ処理が実行されていない可能性があります。"
+                    )
 
-        # 今日のログファイル
-        log_file = os.path.join(log_dir, f"pdf_merge_{datetime.now():%Y%m%d}.log")
+            thread_safe_call(self.tab, update_ui)
 
-        if os.path.exists(log_file):
-            # ログファイルをデフォルトのテキストエディタで開く
-            if open_file_or_folder(log_file, self._show_file_open_error):
-                self.update_status("ログファイルを開きました")
-        else:
-            # ログファイルが存在しない場合はログディレクトリを開く
-            if os.path.exists(log_dir):
-                if open_file_or_folder(log_dir, self._show_file_open_error):
-                    self.update_status("ログディレクトリを開きました")
-            else:
-                messagebox.showwarning(
-                    "ログファイルなし",
-                    "ログファイルが見つかりません。\n\nまだ処理が実行されていない可能性があります。"
-                )
+        self.run_in_background(probe_task)
@@ -164,6 +164,30 @@ def update_status(status_bar: tk.Label, message: str) -> None:
     thread_safe_call(status_bar, _update)
 
 
+# メッセージタイプに応じた装飾
+LOG_PREFIXES = {
+    "info": "ℹ️ ",
+    "success": "✅ ",
+    "error": "❌ ",
+    "warning": "⚠️ ",
+}
+
+
+def format_log_line(message: str, msg_type: str = "normal") -> str:
+    """
+    ログウィジェットに表示する1行を整形（タイムスタンプ・装飾付き、改行込み）
+
+    Args:
+        message: 表示するメッセージ
+        msg_type: メッセージタイプ（info, success, error, warning, normal）
+
+    Returns:
+        整形済みの行
+    """
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    return f"[{timestamp}] {LOG_PREFIXES.get(msg_type, '')}{message}\n"
+
+
 def log_message(log_widget: Any, message: str, msg_type: str = "normal") -> None:
     """
     ログにメッセージを追加（色付き、スレッドセーフ）
@@ -173,21 +197,12 @@ def log_message(log_widget: Any, message: str, msg_type: str = "normal") -> None
         message: 表示するメッセージ
         msg_type: メッセージタイプ（info, success, error, warning, normal）
     """
+    line = format_log_line(message, msg_type)
+
     def _log():
         try:
             log_widget.config(state="normal")
-
-            # メッセージタイプに応じた装飾
-            prefixes = {
-                "info": "ℹ️ ",
-                "success": "✅ ",
-                "error": "❌ ",
-                "warning": "⚠️ ",
-            }
-            prefix = prefixes.get(msg_type, "")
-
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            log_widget.insert(tk.END, f"[{timestamp}] {prefix}{message}\n")
+            log_widget.insert(tk.END, line)
             log_widget.see(tk.END)
             log_widget.config(state="disabled")
         except tk.TclError:
@@ -209,14 +224,14 @@ def set_button_state(
         button: 対象のボタン
         enabled: 有効にするかどうか
         status_label: ステータスラベル（オプション）
-        status_text: ステータステキスト
+        status_text: ステータステキスト（有効化時は処理結果の表示、省略時はクリア）
     """
     def _set_state():
         try:
             if enabled:
                 button.config(state="normal", cursor="hand2")
                 if status_label:
-                    status_label.config(text="")
+                    status_label.config(text=status_text)
             else:
                 button.config(state="disabled", cursor="")
                 if status_label:
@@ -315,6 +330,7 @@ def open_file_or_folder(path: str, on_error: Optional[Callable[[str], None]] = N
 
     try:
         import os
+        import stat
         path_obj = Path(path)
 
         # パスの正規化（フリーズ防止: resolve()を使わない）
@@ -344,15 +360,17 @@ def open_file_or_folder(path: str, on_error: Optional[Callable[[str], None]] = N
             logger.error(f"無効な文字を含むパス: {repr(path_str)}")
             return False
 
-        # 存在チェック（os.path経由で高速化・フリーズ防止）
-        if not os.path.exists(path_str):
+        # 存在チェックとファイル/フォルダの判定を1回のstatで行う（ネットワークドライブでのフリーズ防止）
+        try:
+            is_dir = stat.S_ISDIR(os.stat(path_str).st_mode)
+        except OSError:
             if on_error:
                 on_error(f"指定されたパスが存在しません:\n{path}")
             logger.warning(f"パスが存在しません: {path_str}")
             return False
 
-        # ファイル/フォルダを開く（os.path経由でチェック）
-        if os.path.isdir(path_str):
+        # ファイル/フォルダを開く
+        if is_dir:
             # フォルダの場合: エクスプローラーで開く
             # subprocess.runを使用してプロセス管理を簡潔に（リソースリーク防止）
             try:
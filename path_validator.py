@@ -5,11 +5,16 @@
 2025年ベストプラクティスに準拠（pathlibベース、Python 3.8+互換）
 """
 import logging
+import os
 import re
+import stat
 import sys
+import threading
+import time
 import unicodedata
+from collections import OrderedDict
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 from constants import PathConstants
 
@@ -18,6 +23,9 @@ logger = logging.getLogger(__name__)
 # モジュールレベルでバージョン判定（起動時に1回だけ実行）
 HAS_IS_RELATIVE_TO = sys.version_info >= (3, 9)
 
+# Windows/Linux/macOSの無効文字（< > : " / \ | ? * および \x00-\x1f）
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
 
 def _check_path_security(path: Path, base_resolved: Path) -> bool:
     """
@@ -45,6 +53,37 @@ def _check_path_security(path: Path, base_resolved: Path) -> bool:
             return False
 
 
+# get_safe_initial_dirの結果キャッシュ: (パス文字列, フォールバック) -> (取得時刻, 初期ディレクトリ)
+# UIスレッドとワーカースレッドの両方から使われるため、読み書きはロック下で行う
+_safe_initial_dir_cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[float, Path]]" = OrderedDict()
+_safe_initial_dir_lock = threading.Lock()
+
+# 検証1回分のstat結果の共有用（パス -> stat結果、存在しない場合はNone）
+StatCache = Dict[Path, Optional[os.stat_result]]
+
+
+def _stat_or_none(path: Path, stat_cache: Optional[StatCache] = None) -> Optional[os.stat_result]:
+    """
+    パスのstat結果を取得（存在しない・アクセスできない場合はNone）
+
+    exists() と is_dir()/is_file() を続けて呼ぶとstatが2回走るため、
+    1回のstatで存在と種別をまとめて判定する。
+
+    Args:
+        path: 対象のパス
+        stat_cache: 指定時は同じパスのstat結果を再利用し、新しい結果を登録する
+    """
+    if stat_cache is not None and path in stat_cache:
+        return stat_cache[path]
+    try:
+        st: Optional[os.stat_result] = path.stat()
+    except OSError:
+        st = None
+    if stat_cache is not None:
+        stat_cache[path] = st
+    return st
+
+
 class PathValidationError(Exception):
     """パス検証エラー"""
     pass
@@ -58,6 +97,10 @@ class PathValidator:
     セキュリティ（ディレクトリトラバーサル対策）を含む
     """
 
+    # get_safe_initial_dirの結果を再利用する期間（秒）と最大件数
+    SAFE_DIR_CACHE_TTL = 5.0
+    SAFE_DIR_CACHE_MAX_SIZE = 32
+
     # Windows予約名
     WINDOWS_RESERVED_NAMES = (
         'CON', 'PRN', 'AUX', 'NUL',
@@ -104,7 +147,9 @@ class PathValidator:
     def validate_directory(
         path_str: str,
         must_exist: bool = True,
-        base_dir: Optional[Path] = None
+        base_dir: Optional[Path] = None,
+        path_stat: Optional[os.stat_result] = None,
+        stat_cache: Optional[StatCache] = None
     ) -> Tuple[bool, Optional[str], Optional[Path]]:
         """
         ディレクトリパスを検証
@@ -113,6 +158,8 @@ class PathValidator:
             path_str: 検証するパス文字列
             must_exist: 存在チェックを行うか
             base_dir: セキュリティチェック用の基準ディレクトリ
+            path_stat: 呼び出し側で取得済みのstat結果（指定時は存在チェックのstatを省略し、この結果で判定する）
+            stat_cache: 続けて行う他の検証とstat結果を共有する辞書（省略時は共有しない）
 
         Returns:
             (is_valid, error_message, normalized_path)のタプル
@@ -129,16 +176,17 @@ class PathValidator:
 
             # 存在チェック
             if must_exist:
-                if not path.exists():
+                st = path_stat if path_stat is not None else _stat_or_none(path, stat_cache)
+                if st is None:
                     # 親ディレクトリの存在を確認して詳細なエラーメッセージ
                     parent = path.parent
-                    if parent.exists():
+                    if _stat_or_none(parent, stat_cache) is not None:
                         return False, f"ディレクトリが存在しません: {path}\n親ディレクトリは存在します: {parent}", None
                     else:
                         return False, f"ディレクトリが存在しません: {path}", None
 
                 # ディレクトリであることを確認
-                if not path.is_dir():
+                if not stat.S_ISDIR(st.st_mode):
                     return False, f"指定されたパスはディレクトリではありません: {path}", None
 
             return True, None, path
@@ -153,7 +201,8 @@ class PathValidator:
     def validate_file_path(
         path_str: str,
         must_exist: bool = False,
-        allowed_extensions: Optional[list] = None
+        allowed_extensions: Optional[list] = None,
+        stat_cache: Optional[StatCache] = None
     ) -> Tuple[bool, Optional[str], Optional[Path]]:
         """
         ファイルパスを検証
@@ -162,6 +211,7 @@ class PathValidator:
             path_str: 検証するパス文字列
             must_exist: 存在チェックを行うか
             allowed_extensions: 許可する拡張子のリスト（例: ['.pdf', '.txt']）
+            stat_cache: 続けて行う他の検証とstat結果を共有する辞書（省略時は共有しない）
 
         Returns:
             (is_valid, error_message, normalized_path)のタプル
@@ -177,20 +227,21 @@ class PathValidator:
 
             # 存在チェック
             if must_exist:
-                if not path.exists():
+                st = _stat_or_none(path, stat_cache)
+                if st is None:
                     parent = path.parent
-                    if parent.exists():
+                    if _stat_or_none(parent, stat_cache) is not None:
                         return False, f"ファイルが存在しません: {path}\n親ディレクトリは存在します: {parent}", None
                     else:
                         return False, f"ファイルが存在しません: {path}", None
 
                 # ファイルであることを確認
-                if not path.is_file():
+                if not stat.S_ISREG(st.st_mode):
                     return False, f"指定されたパスはファイルではありません: {path}", None
             else:
                 # 保存先の場合、親ディレクトリが存在するか確認
                 parent = path.parent
-                if not parent.exists():
+                if _stat_or_none(parent, stat_cache) is None:
                     return False, f"保存先ディレクトリが存在しません: {parent}", None
 
             return True, None, path
@@ -206,6 +257,9 @@ class PathValidator:
         """
         ファイルダイアログ用の安全な初期ディレクトリを取得
 
+        Google Drive等のネットワーク上のパスでは確認に時間がかかるため、
+        SAFE_DIR_CACHE_TTL 秒以内の同じ問い合わせには前回の結果を返す。
+
         Args:
             path_str: ユーザー入力のパス文字列
             fallback: フォールバックディレクトリ（Noneの場合はホームディレクトリ）
@@ -213,6 +267,32 @@ class PathValidator:
         Returns:
             安全な初期ディレクトリPath
         """
+        key = (path_str, str(fallback) if fallback is not None else None)
+        now = time.monotonic()
+        with _safe_initial_dir_lock:
+            cached = _safe_initial_dir_cache.get(key)
+            if cached is not None and now - cached[0] < PathValidator.SAFE_DIR_CACHE_TTL:
+                _safe_initial_dir_cache.move_to_end(key)
+                return cached[1]
+
+        # 時間のかかる確認はロックの外で行う（他スレッドのキャッシュ参照を待たせない）
+        result = PathValidator._find_safe_initial_dir(path_str, fallback)
+        with _safe_initial_dir_lock:
+            _safe_initial_dir_cache[key] = (now, result)
+            _safe_initial_dir_cache.move_to_end(key)
+            while len(_safe_initial_dir_cache) > PathValidator.SAFE_DIR_CACHE_MAX_SIZE:
+                _safe_initial_dir_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def invalidate_safe_dir_cache() -> None:
+        """get_safe_initial_dirのキャッシュを破棄（設定の保存・再読み込み時に使用）"""
+        with _safe_initial_dir_lock:
+            _safe_initial_dir_cache.clear()
+
+    @staticmethod
+    def _find_safe_initial_dir(path_str: str, fallback: Optional[Path]) -> Path:
+        """get_safe_initial_dirの本体（キャッシュなし）"""
         try:
             if path_str and path_str.strip():
                 path = PathValidator.normalize_path(path_str)
@@ -224,7 +304,7 @@ class PathValidator:
                 # ファイルの場合は親ディレクトリ
                 if path.parent.exists():
                     return path.parent
-        except (OSError, ValueError) as e:
+        except (OSError, ValueError, PathValidationError) as e:
             logger.debug(f"パス正規化失敗: {e}")
             # フォールバックへ
 
@@ -272,9 +352,7 @@ class PathValidator:
         cleaned = ''.join(char for char in normalized if ord(char) >= 0x20 and ord(char) != 0x7f)
 
         # Windows/Linux/macOSの無効文字を置換
-        # < > : " / \ | ? * および \x00-\x1f
-        invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        cleaned = re.sub(invalid_chars, replacement, cleaned)
+        cleaned = _INVALID_FILENAME_CHARS_RE.sub(replacement, cleaned)
 
         # 連続する置換文字を1つに統合
         if replacement:
@@ -20,13 +20,17 @@ logger = logging.getLogger(__name__)
 class PDFMergeOrchestrator:
     """PDF結合のオーケストレーター（全体の流れを制御）"""
 
+    # create_merged_pdf の処理ステップ数（進捗通知の分母）
+    TOTAL_STEPS = 6
+
     def __init__(
         self,
         config: ConfigLoader,
         pdf_converter: PDFConverter,
         pdf_processor: PDFProcessor,
         document_collector: DocumentCollector,
-        cancel_check: Optional[Callable[[], bool]] = None
+        cancel_check: Optional[Callable[[], bool]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> None:
         """
         Args:
@@ -35,6 +39,7 @@ class PDFMergeOrchestrator:
             pdf_processor: PDFProcessorインスタンス
             document_collector: DocumentCollectorインスタンス
             cancel_check: キャンセル状態をチェックするコールバック関数
+            progress_callback: 進捗を通知するコールバック関数(完了ステップ数, 全ステップ数)
         """
         self.config = config
         self.converter = pdf_converter
@@ -42,11 +47,17 @@ class PDFMergeOrchestrator:
         self.collector = document_collector
         self.temp_dir = config.get_temp_dir()
         self._cancel_check = cancel_check or (lambda: False)
+        self._progress_callback = progress_callback
 
     def is_cancelled(self) -> bool:
         """キャンセルされたかどうかを確認"""
         return self._cancel_check()
 
+    def _report_progress(self, completed_steps: int) -> None:
+        """完了したステップ数を通知"""
+        if self._progress_callback:
+            self._progress_callback(completed_steps, self.TOTAL_STEPS)
+
     def _check_cancel(self) -> None:
         """キャンセルされていれば例外を投げる"""
         if self.is_cancelled():
@@ -171,27 +182,32 @@ class PDFMergeOrchestrator:
                 create_separator_for_subfolder
             )
             self._check_cancel()
+            self._report_progress(1)
 
             # 2. 一時的にマージ
             logger.info("[Step 2/6] 一時マージPDFを作成中...")
             self.processor.merge_pdfs(content_pdfs, temp_merged)
             self._check_cancel()
+            self._report_progress(2)
 
             # 3. 目次PDFを生成
             logger.info("[Step 3/6] 目次を作成中...")
             adjusted_toc_entries = self._create_stable_toc_pdf(toc_entries, toc_pdf)
             self._check_cancel()
+            self._report_progress(3)
 
             # 4. 表紙と残りのページに分割
             logger.info("[Step 4/6] 表紙とコンテンツを分割中...")
             cover_pdf, remainder_pdf = self.processor.split_pdf(temp_merged, self.temp_dir)
             self._check_cancel()
+            self._report_progress(4)
 
             # 5. 最終的にマージ（表紙 + 目次 + 残り）
             logger.info("[Step 5/6] 最終PDFをマージ中...")
             final_list = [cover_pdf, toc_pdf, remainder_pdf]
             self.processor.merge_pdfs(final_list, output_pdf)
             self._check_cancel()
+            self._report_progress(5)
 
             # 6. ページ番号を追加（表紙は除外）
             logger.info("[Step 6/6] ページ番号としおりを追加中...")
@@ -200,6 +216,7 @@ class PDFMergeOrchestrator:
 
             # 7. PDFアウトライン（しおり）を設定
             self.processor.set_pdf_outlines(output_pdf, adjusted_toc_entries)
+            self._report_progress(6)
 
             total_pages = self.processor.get_page_count(output_pdf)
             logger.info(f"PDFの作成が完了しました: {output_pdf}")
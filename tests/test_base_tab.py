@@ -0,0 +1,116 @@
+"""
+BaseTab・DaemonThreadPoolExecutor のユニットテスト
+
+タブのバックグラウンド処理用ワーカープールと、ログのまとめ書きの動作をテスト
+"""
+import threading
+
+import pytest
+
+from gui.tabs import base_tab
+from gui.tabs.base_tab import BaseTab, DaemonThreadPoolExecutor
+
+
+@pytest.fixture
+def pool():
+    executor = DaemonThreadPoolExecutor(max_workers=2, thread_name_prefix="Test")
+    yield executor
+    executor.shutdown()
+
+
+class TestDaemonThreadPoolExecutor:
+    """DaemonThreadPoolExecutorのテスト"""
+
+    def test_submit_returns_result(self, pool):
+        """submitしたタスクの戻り値がFutureから取得できる"""
+        future = pool.submit(lambda: 42)
+        assert future.result(timeout=5) == 42
+
+    def test_submit_propagates_exception(self, pool):
+        """タスク内の例外がFutureに設定される"""
+        def fail():
+            raise ValueError("boom")
+
+        future = pool.submit(fail)
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+
+    def test_workers_are_daemon_threads(self, pool):
+        """ワーカーはデーモンスレッド（終了時にjoinされない）"""
+        future = pool.submit(threading.current_thread)
+        worker = future.result(timeout=5)
+        assert worker.daemon
+        assert worker.name.startswith("Test_")
+
+    def test_thread_count_limited_to_max_workers(self, pool):
+        """同時に投入してもmax_workersを超えるスレッドは作られない"""
+        release = threading.Event()
+        futures = [pool.submit(lambda: release.wait(5)) for _ in range(5)]
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+        assert len(pool._threads) <= 2
+
+    def test_shutdown_cancels_pending_tasks(self):
+        """shutdownで未開始のタスクはキャンセルされ、実行中のタスクは待たない"""
+        executor = DaemonThreadPoolExecutor(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+        running = executor.submit(lambda: (started.set(), release.wait(5)))
+        pending = executor.submit(lambda: None)
+        assert started.wait(5)
+
+        executor.shutdown()
+
+        assert pending.cancelled()
+        assert not running.done()
+        release.set()
+        running.result(timeout=5)
+
+    def test_submit_after_shutdown_raises(self):
+        """shutdown後のsubmitはRuntimeError"""
+        executor = DaemonThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+
+class FakeWidget:
+    """ログのまとめ書きに必要なメソッドだけを持つウィジェットの代わり（afterは即時実行）"""
+
+    def __init__(self, *args, **kwargs):
+        self.text = ""
+
+    def after(self, ms, func):
+        func()
+
+    def config(self, **kwargs):
+        pass
+
+    def insert(self, index, text):
+        self.text += text
+
+    def see(self, index):
+        pass
+
+
+class TestBaseTabLog:
+    """BaseTab.logのテスト（ウィジェットは生成しない）"""
+
+    @pytest.fixture
+    def tab(self, monkeypatch):
+        monkeypatch.setattr(base_tab.ttk, "Frame", FakeWidget)
+        return BaseTab(notebook=None, config=None, status_bar=None)
+
+    def test_keeps_all_lines_before_log_frame(self, tab):
+        """ログフレーム作成前に大量に出力されたログも失わない"""
+        for i in range(5000):
+            tab.log(f"line {i}")
+
+        tab.log_widget = FakeWidget()
+        tab._schedule_log_flush()
+
+        lines = tab.log_widget.text.splitlines()
+        assert len(lines) == 5000
+        assert "line 0" in lines[0]
+        assert "line 4999" in lines[-1]
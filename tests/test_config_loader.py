@@ -117,6 +117,33 @@ class TestConfigLoader:
         config2 = ConfigLoader(config_file)
         assert config2.get('new_key') == 'new_value'
 
+    def test_bulk_update_saves_once_on_exit(self, config_file):
+        """bulk_update内の変更はブロックを抜けたときに1回だけ保存される"""
+        config = ConfigLoader(config_file)
+        with config.bulk_update():
+            config.update_year("2026")
+            config.set('bulk_key', value='bulk_value')
+            config.save_config()
+            # ブロック内ではまだファイルに書き込まれていない
+            assert ConfigLoader(config_file).get('bulk_key') is None
+
+        config2 = ConfigLoader(config_file)
+        assert config2.get('bulk_key') == 'bulk_value'
+        assert config2.year == "2026"
+
+    def test_bulk_update_not_saved_on_error(self, config_file):
+        """bulk_update内で例外が発生した場合は保存しない"""
+        config = ConfigLoader(config_file)
+        with pytest.raises(ValueError):
+            with config.bulk_update():
+                config.set('bulk_key', value='bulk_value')
+                raise ValueError("中断")
+
+        assert ConfigLoader(config_file).get('bulk_key') is None
+        # 以降の保存は通常どおり行われる
+        config.save_config()
+        assert ConfigLoader(config_file).get('bulk_key') == 'bulk_value'
+
     def test_get_temp_dir_creates_directory(self, config_file, temp_dir):
         """一時ディレクトリの作成"""
         config = ConfigLoader(config_file)
@@ -6,6 +6,7 @@ FolderStructureDetector のユニットテスト
 import os
 import pytest
 
+from exceptions import CancelledError
 from folder_structure_detector import FolderStructureDetector, PlanType, DetectionResult
 
 
@@ -138,6 +139,21 @@ class TestDetectStructureEdgeCases:
         assert result.confidence == 0.0
         assert len(result.issues) > 0
 
+    def test_cancel_check_raises_cancelled(self, detector, temp_dir):
+        """cancel_checkがTrueを返すとCancelledErrorが送出される"""
+        os.makedirs(os.path.join(temp_dir, "01 Section", "sub"))
+
+        with pytest.raises(CancelledError):
+            detector.detect_structure(temp_dir, cancel_check=lambda: True)
+
+    def test_cancel_check_false_does_not_interrupt(self, detector, temp_dir):
+        """cancel_checkがFalseなら通常どおり判定される"""
+        os.makedirs(os.path.join(temp_dir, "01 Section", "sub"))
+
+        result = detector.detect_structure(temp_dir, cancel_check=lambda: False)
+
+        assert result.evidence['main_dir_count'] == 1
+
 
 class TestScoreCalculation:
     """スコア計算のテスト"""
@@ -0,0 +1,289 @@
+"""
+PathValidatorのテスト
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import path_validator
+from path_validator import PathValidator, PathValidationError
+
+
+@pytest.fixture(autouse=True)
+def clear_safe_dir_cache():
+    """テスト間でget_safe_initial_dirのキャッシュを共有しない"""
+    PathValidator.invalidate_safe_dir_cache()
+    yield
+    PathValidator.invalidate_safe_dir_cache()
+
+
+@pytest.fixture
+def find_calls(monkeypatch):
+    """_find_safe_initial_dirの呼び出し（キャッシュを通らなかった問い合わせ）を記録"""
+    calls = []
+    original = PathValidator._find_safe_initial_dir
+
+    def recording(path_str, fallback):
+        calls.append(path_str)
+        return original(path_str, fallback)
+
+    monkeypatch.setattr(PathValidator, "_find_safe_initial_dir", staticmethod(recording))
+    return calls
+
+
+class TestGetSafeInitialDir:
+    """get_safe_initial_dirのテスト"""
+
+    def test_existing_directory(self, tmp_path):
+        """存在するディレクトリはそのまま返す"""
+        assert PathValidator.get_safe_initial_dir(str(tmp_path)) == tmp_path.resolve()
+
+    def test_file_returns_parent(self, tmp_path):
+        """ファイルの場合は親ディレクトリを返す"""
+        file_path = tmp_path / "test.pdf"
+        file_path.write_bytes(b"")
+        assert PathValidator.get_safe_initial_dir(str(file_path)) == tmp_path.resolve()
+
+    def test_cache_hit(self, tmp_path, find_calls):
+        """TTL内の同じ問い合わせはキャッシュから返す"""
+        first = PathValidator.get_safe_initial_dir(str(tmp_path))
+        second = PathValidator.get_safe_initial_dir(str(tmp_path))
+        assert first == second
+        assert find_calls == [str(tmp_path)]
+
+    def test_cache_key_includes_fallback(self, tmp_path, find_calls):
+        """フォールバックが異なる問い合わせは別々に確認する"""
+        PathValidator.get_safe_initial_dir(str(tmp_path))
+        PathValidator.get_safe_initial_dir(str(tmp_path), fallback=tmp_path)
+        assert len(find_calls) == 2
+
+    def test_cache_expires_after_ttl(self, tmp_path, find_calls, monkeypatch):
+        """TTLを過ぎたら確認し直す"""
+        now = [1000.0]
+        monkeypatch.setattr(path_validator.time, "monotonic", lambda: now[0])
+
+        PathValidator.get_safe_initial_dir(str(tmp_path))
+        now[0] += PathValidator.SAFE_DIR_CACHE_TTL - 0.1
+        PathValidator.get_safe_initial_dir(str(tmp_path))
+        assert len(find_calls) == 1
+
+        now[0] += 0.2
+        PathValidator.get_safe_initial_dir(str(tmp_path))
+        assert len(find_calls) == 2
+
+    def test_cache_evicts_least_recently_used(self, tmp_path, find_calls, monkeypatch):
+        """最大件数を超えたら最も古く使われた問い合わせから破棄する"""
+        monkeypatch.setattr(PathValidator, "SAFE_DIR_CACHE_MAX_SIZE", 2)
+        dirs = []
+        for name in ("a", "b", "c"):
+            directory = tmp_path / name
+            directory.mkdir()
+            dirs.append(str(directory))
+
+        PathValidator.get_safe_initial_dir(dirs[0])
+        PathValidator.get_safe_initial_dir(dirs[1])
+        PathValidator.get_safe_initial_dir(dirs[0])  # aを最近使用にする
+        PathValidator.get_safe_initial_dir(dirs[2])  # bが破棄される
+        assert len(path_validator._safe_initial_dir_cache) == 2
+
+        find_calls.clear()
+        PathValidator.get_safe_initial_dir(dirs[0])
+        assert find_calls == []
+        PathValidator.get_safe_initial_dir(dirs[1])
+        assert find_calls == [dirs[1]]
+
+    def test_invalidate_safe_dir_cache(self, tmp_path, find_calls):
+        """キャッシュ破棄後は確認し直す"""
+        PathValidator.get_safe_initial_dir(str(tmp_path))
+        PathValidator.invalidate_safe_dir_cache()
+        assert len(path_validator._safe_initial_dir_cache) == 0
+
+        PathValidator.get_safe_initial_dir(str(tmp_path))
+        assert len(find_calls) == 2
+
+    def test_missing_path_uses_fallback(self, tmp_path):
+        """存在しないパスの場合はフォールバックを返す"""
+        missing = tmp_path / "missing" / "child"
+        assert PathValidator.get_safe_initial_dir(str(missing), fallback=tmp_path) == tmp_path
+
+    def test_empty_path_without_fallback_returns_home(self):
+        """未入力でフォールバックもない場合はホームディレクトリ"""
+        assert PathValidator.get_safe_initial_dir("") == Path.home()
+
+    def test_invalid_path_uses_fallback(self, tmp_path, monkeypatch):
+        """パスの正規化に失敗した場合（PathValidationError）もフォールバックを返す"""
+        def raise_error(path_str):
+            raise PathValidationError("無効なパス形式")
+
+        monkeypatch.setattr(PathValidator, "normalize_path", staticmethod(raise_error))
+        assert PathValidator.get_safe_initial_dir("invalid", fallback=tmp_path) == tmp_path
+
+
+@pytest.fixture
+def stat_calls(monkeypatch):
+    """
+    Path.statの呼び出し先を記録
+
+    resolve()の内部で行われるstatを数えないよう、正規化は解決済みのパスをそのまま返す。
+    """
+    calls = []
+    original = Path.stat
+
+    def recording(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(PathValidator, "normalize_path", staticmethod(lambda path_str: Path(path_str)))
+    monkeypatch.setattr(Path, "stat", recording)
+    return calls
+
+
+class TestStatCache:
+    """stat結果の共有（_stat_or_none / stat_cache）のテスト"""
+
+    def test_stat_or_none_missing_path(self, tmp_path):
+        """存在しないパスはNone"""
+        assert path_validator._stat_or_none(tmp_path / "missing") is None
+
+    def test_stat_or_none_reuses_cached_result(self, tmp_path, stat_calls):
+        """同じstat_cacheでは同じパスを2回statしない"""
+        stat_cache = {}
+        first = path_validator._stat_or_none(tmp_path, stat_cache)
+        second = path_validator._stat_or_none(tmp_path, stat_cache)
+        assert first is second
+        assert stat_calls == [tmp_path]
+
+    def test_stat_or_none_caches_missing_path(self, tmp_path, stat_calls):
+        """存在しない結果（None）も共有する"""
+        missing = tmp_path / "missing"
+        stat_cache = {}
+        assert path_validator._stat_or_none(missing, stat_cache) is None
+        assert path_validator._stat_or_none(missing, stat_cache) is None
+        assert stat_cache == {missing: None}
+        assert stat_calls == [missing]
+
+    def test_validations_share_stat_result(self, tmp_path, stat_calls):
+        """入力フォルダと出力先の親フォルダが同じ場合はstatが1回で済む"""
+        directory = tmp_path.resolve()
+        stat_calls.clear()
+        stat_cache = {}
+        dir_valid, _, _ = PathValidator.validate_directory(str(directory), stat_cache=stat_cache)
+        file_valid, _, _ = PathValidator.validate_file_path(
+            str(directory / "output.pdf"), stat_cache=stat_cache
+        )
+        assert dir_valid and file_valid
+        assert stat_calls == [directory]
+
+    def test_without_stat_cache_stats_each_time(self, tmp_path, stat_calls):
+        """stat_cacheを省略した場合は検証ごとにstatする"""
+        directory = tmp_path.resolve()
+        stat_calls.clear()
+        PathValidator.validate_directory(str(directory))
+        PathValidator.validate_directory(str(directory))
+        assert stat_calls == [directory, directory]
+
+    @pytest.mark.parametrize("use_cache", [False, True])
+    def test_missing_directory_messages(self, tmp_path, use_cache):
+        """存在しないディレクトリのエラーメッセージはstat_cacheの有無で変わらない"""
+        stat_cache = {} if use_cache else None
+        missing = (tmp_path / "missing").resolve()
+        is_valid, error_msg, path = PathValidator.validate_directory(str(missing), stat_cache=stat_cache)
+        assert not is_valid and path is None
+        assert error_msg == f"ディレクトリが存在しません: {missing}\n親ディレクトリは存在します: {missing.parent}"
+
+        deep = (tmp_path / "missing" / "child").resolve()
+        _, error_msg, _ = PathValidator.validate_directory(str(deep), stat_cache=stat_cache)
+        assert error_msg == f"ディレクトリが存在しません: {deep}"
+
+    @pytest.mark.parametrize("use_cache", [False, True])
+    def test_missing_file_messages(self, tmp_path, use_cache):
+        """存在しないファイル・保存先のエラーメッセージはstat_cacheの有無で変わらない"""
+        stat_cache = {} if use_cache else None
+        missing = (tmp_path / "missing.pdf").resolve()
+        is_valid, error_msg, _ = PathValidator.validate_file_path(
+            str(missing), must_exist=True, stat_cache=stat_cache
+        )
+        assert not is_valid
+        assert error_msg == f"ファイルが存在しません: {missing}\n親ディレクトリは存在します: {missing.parent}"
+
+        output = (tmp_path / "missing" / "output.pdf").resolve()
+        _, error_msg, _ = PathValidator.validate_file_path(str(output), stat_cache=stat_cache)
+        assert error_msg == f"保存先ディレクトリが存在しません: {output.parent}"
+
+    @pytest.mark.parametrize("use_cache", [False, True])
+    def test_wrong_type_messages(self, tmp_path, use_cache):
+        """ファイルとディレクトリを取り違えた場合のエラーメッセージ"""
+        stat_cache = {} if use_cache else None
+        file_path = (tmp_path / "test.pdf").resolve()
+        file_path.write_bytes(b"")
+
+        _, error_msg, _ = PathValidator.validate_directory(str(file_path), stat_cache=stat_cache)
+        assert error_msg == f"指定されたパスはディレクトリではありません: {file_path}"
+
+        _, error_msg, _ = PathValidator.validate_file_path(
+            str(tmp_path), must_exist=True, stat_cache=stat_cache
+        )
+        assert error_msg == f"指定されたパスはファイルではありません: {tmp_path.resolve()}"
+
+
+class TestValidateDirectoryPathStat:
+    """validate_directoryのpath_stat（呼び出し側で取得済みのstat結果）のテスト"""
+
+    def test_path_stat_skips_stat(self, tmp_path, stat_calls):
+        """path_statを渡した場合は存在チェックのstatを行わない"""
+        directory = tmp_path.resolve()
+        path_stat = os.stat(directory)
+        stat_calls.clear()
+
+        is_valid, error_msg, path = PathValidator.validate_directory(str(directory), path_stat=path_stat)
+
+        assert is_valid and error_msg is None
+        assert path == directory
+        assert stat_calls == []
+
+    def test_none_path_stat_falls_back_to_stat(self, tmp_path, stat_calls):
+        """path_statがNoneの場合は通常どおりstatする"""
+        directory = tmp_path.resolve()
+        stat_calls.clear()
+
+        is_valid, _, _ = PathValidator.validate_directory(str(directory), path_stat=None)
+
+        assert is_valid
+        assert stat_calls == [directory]
+
+    def test_none_path_stat_for_missing_directory(self, tmp_path):
+        """path_statがNoneで存在しない場合は通常のエラーメッセージ"""
+        missing = (tmp_path / "missing").resolve()
+        is_valid, error_msg, _ = PathValidator.validate_directory(str(missing), path_stat=None)
+        assert not is_valid
+        assert error_msg == f"ディレクトリが存在しません: {missing}\n親ディレクトリは存在します: {missing.parent}"
+
+    def test_stale_path_stat_of_file(self, tmp_path):
+        """取得後にファイルへ置き換わった場合など、ファイルのstat結果ならディレクトリではないと判定"""
+        directory = tmp_path.resolve()
+        file_path = directory / "test.pdf"
+        file_path.write_bytes(b"")
+
+        is_valid, error_msg, path = PathValidator.validate_directory(
+            str(directory), path_stat=os.stat(file_path)
+        )
+
+        assert not is_valid and path is None
+        assert error_msg == f"指定されたパスはディレクトリではありません: {directory}"
+
+    def test_path_stat_ignored_without_must_exist(self, tmp_path):
+        """must_exist=Falseの場合はpath_statを参照しない"""
+        file_path = tmp_path / "test.pdf"
+        file_path.write_bytes(b"")
+        missing = tmp_path / "missing"
+
+        is_valid, _, _ = PathValidator.validate_directory(
+            str(missing), must_exist=False, path_stat=os.stat(file_path)
+        )
+
+        assert is_valid
@@ -126,6 +126,46 @@ class TestCreateMergedPDF:
         with pytest.raises(CancelledError):
             orch.create_merged_pdf("/target", "/output.pdf")
 
+    def test_progress_reported_after_each_step(self, mock_deps):
+        """各ステップ完了時に(完了ステップ数, 全ステップ数)が通知される"""
+        config, converter, processor, collector = mock_deps
+        progress = MagicMock()
+        orch = PDFMergeOrchestrator(
+            config, converter, processor, collector,
+            progress_callback=progress
+        )
+
+        collector.collect_documents.return_value = (
+            [("Section1", 1, 3)], ["/tmp/a.pdf"]
+        )
+        processor.split_pdf.return_value = ("/tmp/cover.pdf", "/tmp/remainder.pdf")
+        processor.get_page_count.side_effect = _page_count_side_effect(
+            config.get_temp_dir.return_value,
+            toc_pages=1,
+            default_pages=10
+        )
+
+        orch.create_merged_pdf("/target", "/output.pdf")
+
+        total = PDFMergeOrchestrator.TOTAL_STEPS
+        assert progress.call_args_list == [call(step, total) for step in range(1, total + 1)]
+
+    def test_no_progress_after_cancel(self, mock_deps):
+        """キャンセルされたステップの進捗は通知されない"""
+        config, converter, processor, collector = mock_deps
+        progress = MagicMock()
+        orch = PDFMergeOrchestrator(
+            config, converter, processor, collector,
+            cancel_check=lambda: True,
+            progress_callback=progress
+        )
+        collector.collect_documents.return_value = ([], [])
+
+        with pytest.raises(CancelledError):
+            orch.create_merged_pdf("/target", "/output.pdf")
+
+        progress.assert_not_called()
+
     def test_separator_flag_passed_to_collector(self, orchestrator, mock_deps):
         """create_separator_for_subfolderフラグがcollectorに渡される"""
         config, _, processor, collector = mock_deps
@@ -0,0 +1,134 @@
+"""
+PDFTab のユニットテスト
+
+タブ終了時のバックグラウンド処理の停止と、統合終了時の表示をテスト（ウィジェットは生成しない）
+"""
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from gui.tabs.pdf_tab import PDFTab
+
+
+@pytest.fixture
+def tab():
+    """ウィジェットを生成せず、終了処理に必要な状態だけを持つPDFTab"""
+    pdf_tab = PDFTab.__new__(PDFTab)
+    pdf_tab._executor = None
+    pdf_tab._task_future = None
+    pdf_tab._cancelled = False
+    pdf_tab._detect_future = None
+    pdf_tab._detect_cancel_event = None
+    pdf_tab._validation_future = None
+    pdf_tab._validation_generation = 0
+    return pdf_tab
+
+
+class TestPDFTabShutdown:
+    """PDFTab.shutdown_executorのテスト"""
+
+    def test_shutdown_stops_detection(self, tab):
+        """終了時に実行中の構造判定へキャンセルが通知される"""
+        cancel_event = threading.Event()
+        future: Future = Future()
+        tab._detect_cancel_event = cancel_event
+        tab._detect_future = future
+
+        tab.shutdown_executor()
+
+        assert cancel_event.is_set()
+        assert future.cancelled()
+        assert tab._detect_future is None
+        assert tab._detect_cancel_event is None
+
+    def test_shutdown_cancels_merge(self, tab):
+        """終了時にPDF統合へキャンセルが要求される"""
+        future: Future = Future()
+        tab._task_future = future
+
+        tab.shutdown_executor()
+
+        assert tab._is_cancelled()
+        assert future.cancelled()
+
+    def test_shutdown_cancels_validation(self, tab):
+        """終了時に入力検証が取り消され、実行中の検証結果は破棄される"""
+        future: Future = Future()
+        tab._validation_future = future
+        tab._validation_generation = 3
+
+        tab.shutdown_executor()
+
+        assert future.cancelled()
+        assert tab._validation_future is None
+        assert tab._validation_generation == 4
+
+    def test_shutdown_cancels_merge_detection_and_validation(self, tab):
+        """PDF統合と構造判定・検証が同時に実行中でもすべて停止される"""
+        merge: Future = Future()
+        merge.set_running_or_notify_cancel()
+        detection: Future = Future()
+        validation: Future = Future()
+        cancel_event = threading.Event()
+        tab._task_future = merge
+        tab._detect_future = detection
+        tab._detect_cancel_event = cancel_event
+        tab._validation_future = validation
+
+        tab.shutdown_executor()
+
+        # 実行中の統合はキャンセルフラグで中断される
+        assert tab._is_cancelled()
+        assert cancel_event.is_set()
+        assert detection.cancelled()
+        assert validation.cancelled()
+
+    def test_shutdown_without_running_tasks(self, tab):
+        """実行中の処理がなくても終了できる"""
+        tab.shutdown_executor()
+        assert tab._is_cancelled()
+
+
+class FakeWidget:
+    """config/after_idleだけを持つウィジェットの代わり（after_idleは即時実行）"""
+
+    def __init__(self):
+        self.options = {}
+
+    def config(self, **kwargs):
+        self.options.update(kwargs)
+
+    def after_idle(self, func):
+        func()
+
+
+class TestResetMergeUI:
+    """PDFTab._reset_merge_uiのテスト"""
+
+    @pytest.mark.parametrize("status_text", ["✅ 完了", "⚠️ キャンセル", "❌ エラー"])
+    def test_shows_result_next_to_run_button(self, tab, status_text):
+        """統合の結果を実行ボタン横に表示し、ボタンを待機状態へ戻す"""
+        tab.run_button = FakeWidget()
+        tab.cancel_button = FakeWidget()
+        tab.status_label = FakeWidget()
+
+        tab._reset_merge_ui(status_text)
+
+        assert tab.status_label.options["text"] == status_text
+        assert tab.run_button.options["state"] == "normal"
+        assert tab.cancel_button.options["state"] == "disabled"
+
+    def test_cancel_before_start_shows_cancelled(self, tab):
+        """開始前にキャンセルされた場合もキャンセルを表示する"""
+        tab.tab = FakeWidget()
+        tab.run_button = FakeWidget()
+        tab.cancel_button = FakeWidget()
+        tab.status_label = FakeWidget()
+        tab.log = lambda message, level="info": None
+        future: Future = Future()
+        future.cancel()
+
+        tab._on_merge_future_done(future)
+
+        assert tab.status_label.options["text"] == "⚠️ キャンセル"
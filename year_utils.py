@@ -4,6 +4,7 @@
 教育計画は次年度のものを作成する運用に対応した年度計算機能を提供
 """
 import datetime
+from functools import lru_cache
 from typing import Tuple
 
 
@@ -45,9 +46,10 @@ def calculate_next_fiscal_year() -> Tuple[str, str]:
     return year, year_short
 
 
+@lru_cache(maxsize=64)
 def calculate_year_short(year: str) -> str:
     """
-    西暦から和暦短縮形を計算
+    西暦から和暦短縮形を計算（入力ごとに結果をキャッシュ）
 
     Args:
         year: 西暦4桁の文字列（例: "2026"）